@@ -30,13 +30,13 @@ class Equity(Asset):
         self.name = name
         self.symbol = symbol
         self.tax_exempt = tax_exempt
+        self._repr = "Equity(name='%s', symbol='%s', tax_exempt=%s)" % (
+            name, symbol, tax_exempt
+        )
 
     def __repr__(self):
         """
-        String representation of the Equity Asset.
+        String representation of the Equity Asset, formatted
+        once at construction.
         """
-        return (
-            "Equity(name='%s', symbol='%s', tax_exempt=%s)" % (
-                self.name, self.symbol, self.tax_exempt
-            )
-        )
+        return self._repr
@@ -318,8 +318,8 @@ class Portfolio(object):
                     )
                 )
 
-            self.pos_handler.positions[asset].update_current_price(
-                current_price, current_dt
+            self.pos_handler.update_current_price(
+                asset, current_price, current_dt
             )
 
     def history_to_df(self):
@@ -1,7 +1,5 @@
 from math import floor
 
-import numpy as np
-
 
 class Position(object):
     """
@@ -33,8 +31,32 @@ class Position(object):
         The commission spent on buying assets for this position.
     sell_commission : `float`
         The commission spent on selling assets for this position.
+
+    The direction, market value, average price and P&L values are
+    cached and only recalculated after a transaction, a price update
+    or an assignment to any of the attributes above.
     """
 
+    __slots__ = (
+        'asset',
+        '_current_price',
+        'current_dt',
+        '_buy_quantity',
+        '_sell_quantity',
+        '_avg_bought',
+        '_avg_sold',
+        '_buy_commission',
+        '_sell_commission',
+        '_dirty',
+        '_market_value',
+        '_avg_price',
+        '_unrealised_pnl',
+        '_realised_pnl',
+        '_total_pnl',
+        '_direction',
+        '_repr_prefix'
+    )
+
     def __init__(
         self,
         asset,
@@ -48,14 +70,38 @@ class Position(object):
         sell_commission
     ):
         self.asset = asset
-        self.current_price = current_price
+        self._current_price = current_price
         self.current_dt = current_dt
-        self.buy_quantity = buy_quantity
-        self.sell_quantity = sell_quantity
-        self.avg_bought = avg_bought
-        self.avg_sold = avg_sold
-        self.buy_commission = buy_commission
-        self.sell_commission = sell_commission
+        self._buy_quantity = buy_quantity
+        self._sell_quantity = sell_quantity
+        self._avg_bought = avg_bought
+        self._avg_sold = avg_sold
+        self._buy_commission = buy_commission
+        self._sell_commission = sell_commission
+        self._dirty = True
+        self._repr_prefix = "%s(asset=%s, " % (type(self).__name__, asset)
+
+    def __repr__(self):
+        """
+        Provides a representation of the Position
+        to allow full recreation of the object.
+
+        Returns
+        -------
+        `str`
+            The string representation of the Position.
+        """
+        return self._repr_prefix + (
+            "current_price=%s, current_dt=%s, "
+            "buy_quantity=%s, sell_quantity=%s, "
+            "avg_bought=%s, avg_sold=%s, "
+            "buy_commission=%s, sell_commission=%s)" % (
+                self.current_price, self.current_dt,
+                self.buy_quantity, self.sell_quantity,
+                self.avg_bought, self.avg_sold,
+                self.buy_commission, self.sell_commission
+            )
+        )
 
     @classmethod
     def open_from_transaction(cls, transaction):
@@ -124,6 +170,153 @@ class Position(object):
             else:
                 self.current_dt = dt
 
+    @property
+    def current_price(self):
+        """
+        The current market price of the asset.
+
+        Returns
+        -------
+        `float`
+            The current market price.
+        """
+        return self._current_price
+
+    @current_price.setter
+    def current_price(self, value):
+        """
+        Set the current market price of the asset,
+        invalidating the cached values derived from it.
+        """
+        self._current_price = value
+        self._dirty = True
+
+    @property
+    def buy_quantity(self):
+        """
+        The quantity of the asset bought.
+
+        Returns
+        -------
+        `int`
+            The quantity of assets bought.
+        """
+        return self._buy_quantity
+
+    @buy_quantity.setter
+    def buy_quantity(self, value):
+        """
+        Set the quantity of the asset bought,
+        invalidating the cached values derived from it.
+        """
+        self._buy_quantity = value
+        self._dirty = True
+
+    @property
+    def sell_quantity(self):
+        """
+        The quantity of the asset sold.
+
+        Returns
+        -------
+        `int`
+            The quantity of assets sold.
+        """
+        return self._sell_quantity
+
+    @sell_quantity.setter
+    def sell_quantity(self, value):
+        """
+        Set the quantity of the asset sold,
+        invalidating the cached values derived from it.
+        """
+        self._sell_quantity = value
+        self._dirty = True
+
+    @property
+    def avg_bought(self):
+        """
+        The average price paid for buying assets.
+
+        Returns
+        -------
+        `float`
+            The average purchase price.
+        """
+        return self._avg_bought
+
+    @avg_bought.setter
+    def avg_bought(self, value):
+        """
+        Set the average price paid for buying assets,
+        invalidating the cached values derived from it.
+        """
+        self._avg_bought = value
+        self._dirty = True
+
+    @property
+    def avg_sold(self):
+        """
+        The average price received for selling assets.
+
+        Returns
+        -------
+        `float`
+            The average sale price.
+        """
+        return self._avg_sold
+
+    @avg_sold.setter
+    def avg_sold(self, value):
+        """
+        Set the average price received for selling assets,
+        invalidating the cached values derived from it.
+        """
+        self._avg_sold = value
+        self._dirty = True
+
+    @property
+    def buy_commission(self):
+        """
+        The commission spent on buying assets.
+
+        Returns
+        -------
+        `float`
+            The commission on purchases.
+        """
+        return self._buy_commission
+
+    @buy_commission.setter
+    def buy_commission(self, value):
+        """
+        Set the commission spent on buying assets,
+        invalidating the cached values derived from it.
+        """
+        self._buy_commission = value
+        self._dirty = True
+
+    @property
+    def sell_commission(self):
+        """
+        The commission spent on selling assets.
+
+        Returns
+        -------
+        `float`
+            The commission on sales.
+        """
+        return self._sell_commission
+
+    @sell_commission.setter
+    def sell_commission(self, value):
+        """
+        Set the commission spent on selling assets,
+        invalidating the cached values derived from it.
+        """
+        self._sell_commission = value
+        self._dirty = True
+
     @property
     def direction(self):
         """
@@ -134,10 +327,53 @@ class Position(object):
         `int`
             1 - Long, 0 - No direction, -1 - Short.
         """
-        if self.net_quantity == 0:
-            return 0
+        if self._dirty:
+            self._recompute()
+        return self._direction
+
+    def _recompute(self):
+        """
+        Recalculates the cached direction, market value, average
+        price and P&L values of the Position together in a single pass.
+        """
+        buy_quantity = self._buy_quantity
+        sell_quantity = self._sell_quantity
+        net_quantity = buy_quantity - sell_quantity
+        if net_quantity == 0:
+            direction = 0
+            avg_price = 0.0
+            realised_pnl = self.net_incl_commission
+        elif net_quantity > 0:
+            direction = 1
+            avg_price = (self._avg_bought * buy_quantity + self._buy_commission) / buy_quantity
+            if sell_quantity == 0:
+                realised_pnl = 0.0
+            else:
+                realised_pnl = (
+                    ((self._avg_sold - self._avg_bought) * sell_quantity) -
+                    ((sell_quantity / buy_quantity) * self._buy_commission) -
+                    self._sell_commission
+                )
         else:
-            return np.copysign(1, self.net_quantity)
+            direction = -1
+            avg_price = (self._avg_sold * sell_quantity - self._sell_commission) / sell_quantity
+            if buy_quantity == 0:
+                realised_pnl = 0.0
+            else:
+                realised_pnl = (
+                    ((self._avg_sold - self._avg_bought) * buy_quantity) -
+                    ((buy_quantity / sell_quantity) * self._sell_commission) -
+                    self._buy_commission
+                )
+
+        unrealised_pnl = (self._current_price - avg_price) * net_quantity
+        self._direction = direction
+        self._market_value = self._current_price * net_quantity
+        self._avg_price = avg_price
+        self._unrealised_pnl = unrealised_pnl
+        self._realised_pnl = realised_pnl
+        self._total_pnl = realised_pnl + unrealised_pnl
+        self._dirty = False
 
     @property
     def market_value(self):
@@ -150,7 +386,9 @@ class Position(object):
         `float`
             The current market value of the Position.
         """
-        return self.current_price * self.net_quantity
+        if self._dirty:
+            self._recompute()
+        return self._market_value
 
     @property
     def avg_price(self):
@@ -162,12 +400,9 @@ class Position(object):
         `float`
             The average price on either the long or short side.
         """
-        if self.net_quantity == 0:
-            return 0.0
-        elif self.net_quantity > 0:
-            return (self.avg_bought * self.buy_quantity + self.buy_commission) / self.buy_quantity
-        else:
-            return (self.avg_sold * self.sell_quantity - self.sell_commission) / self.sell_quantity
+        if self._dirty:
+            self._recompute()
+        return self._avg_price
 
     @property
     def net_quantity(self):
@@ -256,26 +491,9 @@ class Position(object):
         `float`
             The calculated realised P&L.
         """
-        if self.direction == 1:
-            if self.sell_quantity == 0:
-                return 0.0
-            else:
-                return (
-                    ((self.avg_sold - self.avg_bought) * self.sell_quantity) -
-                    ((self.sell_quantity / self.buy_quantity) * self.buy_commission) -
-                    self.sell_commission
-                )
-        elif self.direction == -1:
-            if self.buy_quantity == 0:
-                return 0.0
-            else:
-                return (
-                    ((self.avg_sold - self.avg_bought) * self.buy_quantity) -
-                    ((self.buy_quantity / self.sell_quantity) * self.sell_commission) -
-                    self.buy_commission
-                )
-        else:
-            return self.net_incl_commission
+        if self._dirty:
+            self._recompute()
+        return self._realised_pnl
 
     @property
     def unrealised_pnl(self):
@@ -289,7 +507,9 @@ class Position(object):
         `float`
             The calculated unrealised P&L.
         """
-        return (self.current_price - self.avg_price) * self.net_quantity
+        if self._dirty:
+            self._recompute()
+        return self._unrealised_pnl
 
     @property
     def total_pnl(self):
@@ -301,7 +521,9 @@ class Position(object):
         `float`
             The sum of the unrealised and realised P&L.
         """
-        return self.realised_pnl + self.unrealised_pnl
+        if self._dirty:
+            self._recompute()
+        return self._total_pnl
 
     def update_current_price(self, market_price, dt=None):
         """
@@ -323,7 +545,8 @@ class Position(object):
                 'update the position.' % (market_price, self.asset)
             )
         else:
-            self.current_price = market_price
+            self._current_price = market_price
+            self._dirty = True
 
     def _transact_buy(self, quantity, price, commission):
         """
@@ -339,9 +562,12 @@ class Position(object):
         commission : `float`
             The commission paid to the broker for the purchase.
         """
-        self.avg_bought = ((self.avg_bought * self.buy_quantity) + (quantity * price)) / (self.buy_quantity + quantity)
-        self.buy_quantity += quantity
-        self.buy_commission += commission
+        buy_quantity = self._buy_quantity
+        total_quantity = buy_quantity + quantity
+        self._avg_bought = ((self._avg_bought * buy_quantity) + (quantity * price)) / total_quantity
+        self._buy_quantity = total_quantity
+        self._buy_commission += commission
+        self._dirty = True
 
     def _transact_sell(self, quantity, price, commission):
         """
@@ -357,9 +583,12 @@ class Position(object):
         commission : `float`
             The commission paid to the broker for the sale.
         """
-        self.avg_sold = ((self.avg_sold * self.sell_quantity) + (quantity * price)) / (self.sell_quantity + quantity)
-        self.sell_quantity += quantity
-        self.sell_commission += commission
+        sell_quantity = self._sell_quantity
+        total_quantity = sell_quantity + quantity
+        self._avg_sold = ((self._avg_sold * sell_quantity) + (quantity * price)) / total_quantity
+        self._sell_quantity = total_quantity
+        self._sell_commission += commission
+        self._dirty = True
 
     def transact(self, transaction):
         """
@@ -378,26 +607,32 @@ class Position(object):
                     self.asset, transaction.asset
                 )
             )
+        self._transact_unchecked(transaction)
 
+    def _transact_unchecked(self, transaction):
+        """
+        Carries out the Position adjustments for the Transaction
+        without checking that it is in the Position's asset. Used
+        by the PositionHandler, which looks up the Position by the
+        Transaction's asset.
+
+        Parameters
+        ----------
+        transaction : `Transaction`
+            The Transaction to update the Position with.
+        """
         # Nothing to do if the transaction has no quantity
-        if int(floor(transaction.quantity)) == 0:
+        quantity = transaction.quantity
+        if int(floor(quantity)) == 0:
             return
 
         # Depending upon the direction of the transaction
         # ensure the correct calculation is called
-        if transaction.quantity > 0:
-            self._transact_buy(
-                transaction.quantity,
-                transaction.price,
-                transaction.commission
-            )
+        price = transaction.price
+        if quantity > 0:
+            self._transact_buy(quantity, price, transaction.commission)
         else:
-            self._transact_sell(
-                -1.0 * transaction.quantity,
-                transaction.price,
-                transaction.commission
-            )
+            self._transact_sell(-1.0 * quantity, price, transaction.commission)
 
         # Update the current trade information
-        self.update_current_price(transaction.price, transaction.dt)
-        self.current_dt = transaction.dt
+        self.update_current_price(price, transaction.dt)
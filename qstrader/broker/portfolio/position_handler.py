@@ -1,4 +1,5 @@
-from collections import OrderedDict
+import numpy as np
+import pandas as pd
 
 from qstrader.broker.portfolio.position import Position
 
@@ -7,63 +8,356 @@ class PositionHandler(object):
     """
     A class that keeps track of, and updates, the current
     list of Position instances stored in a Portfolio entity.
+
+    The position totals are cached until the positions are next
+    modified. Positions should therefore only be modified via the
+    methods of this class, rather than directly.
     """
 
     def __init__(self):
         """
         Initialise the PositionHandler object to generate
-        an ordered dictionary containing the current positions.
+        a dictionary containing the current positions, which
+        preserves the order in which they were opened.
         """
-        self.positions = OrderedDict()
+        self.positions = {}
+        self._totals = {}
 
     def transact_position(self, transaction):
         """
         Execute the transaction and update the appropriate
         position for the transaction's asset accordingly.
         """
+        self._totals.clear()
         asset = transaction.asset
-        if asset in self.positions:
-            self.positions[asset].transact(transaction)
-        else:
+        position = self.positions.get(asset)
+        if position is None:
             position = Position.open_from_transaction(transaction)
             self.positions[asset] = position
+        else:
+            # The Position was found via the transaction's asset
+            position._transact_unchecked(transaction)
 
         # If the position has zero quantity remove it
-        if self.positions[asset].net_quantity == 0:
+        if position.net_quantity == 0:
             del self.positions[asset]
 
+    def transact_positions(self, transactions):
+        """
+        Execute a batch of transactions and update the appropriate
+        positions accordingly. Transactions in each asset are applied
+        in the order provided.
+
+        Since the long and short legs of a Position are accounted for
+        separately, all transactions in an asset since it was last
+        flat can be aggregated with vectorised NumPy operations rather
+        than being applied one at a time. The resulting positions are
+        identical to those from calling 'transact_position' on each
+        transaction in turn, including the order in which they are held.
+
+        Parameters
+        ----------
+        transactions : `list[Transaction]`
+            The transactions to carry out.
+        """
+        self._totals.clear()
+        asset_rows = {}
+        for row, txn in enumerate(transactions):
+            asset_rows.setdefault(txn.asset, []).append(row)
+
+        opened = {}
+        for asset, rows in asset_rows.items():
+            txns = [transactions[row] for row in rows]
+            open_row = self._transact_asset_batch(
+                asset,
+                np.array(rows),
+                np.array([txn.quantity for txn in txns]),
+                np.array([txn.price for txn in txns], dtype=np.float64),
+                np.array([txn.commission for txn in txns], dtype=np.float64),
+                [txn.dt for txn in txns]
+            )
+            if open_row is not None:
+                opened[asset] = open_row
+        self._move_opened_to_end(opened)
+
+    def transact_positions_from_df(self, df):
+        """
+        Execute a batch of transactions provided as a DataFrame and
+        update the appropriate positions accordingly. Each asset's
+        rows are grouped and applied in the order provided, without
+        constructing a Transaction per row.
+
+        Parameters
+        ----------
+        df : `pd.DataFrame`
+            The transactions to carry out, with 'asset', 'quantity',
+            'price', 'commission' and 'dt' columns. Missing
+            commissions are treated as zero.
+        """
+        self._totals.clear()
+        quantity = df['quantity'].to_numpy()
+        price = df['price'].to_numpy(dtype=np.float64)
+        commission = df['commission'].fillna(0.0).to_numpy(dtype=np.float64)
+        dts = df['dt'].tolist()
+
+        opened = {}
+        for asset, rows in df.groupby('asset', sort=False).indices.items():
+            open_row = self._transact_asset_batch(
+                asset,
+                rows,
+                quantity[rows],
+                price[rows],
+                commission[rows],
+                [dts[row] for row in rows]
+            )
+            if open_row is not None:
+                opened[asset] = open_row
+        self._move_opened_to_end(opened)
+
+    def _move_opened_to_end(self, opened):
+        """
+        Move the positions opened during a batch to the end of the
+        positions dictionary, in the order in which they were opened,
+        as if each transaction had been carried out in turn.
+
+        Parameters
+        ----------
+        opened : `dict{str: int}`
+            The batch row of the opening transaction of each asset
+            whose Position was opened (or reopened) by the batch.
+        """
+        for asset in sorted(opened, key=opened.get):
+            self.positions[asset] = self.positions.pop(asset)
+
+    @staticmethod
+    def _applied_rows(quantity, is_open, start_quantity):
+        """
+        Determine which transactions in a single asset modify its
+        Position when carried out in turn. A zero quantity never does,
+        while a quantity between zero and one is ignored by an open
+        Position but opens a new Position otherwise.
+
+        Parameters
+        ----------
+        quantity : `np.ndarray`
+            The transaction quantities, in execution order.
+        is_open : `bool`
+            Whether the Position is open prior to the transactions.
+        start_quantity : `float`
+            The net quantity of the Position prior to the transactions.
+
+        Returns
+        -------
+        `np.ndarray`
+            Boolean mask of the transactions that modify the Position.
+        """
+        fractional = (quantity > 0) & (quantity < 1)
+        if not fractional.any():
+            return quantity != 0
+
+        # Whether a fractional quantity is applied depends upon
+        # whether the Position is open at the time, so walk the rows
+        applied = np.zeros(len(quantity), dtype=bool)
+        net_quantity = start_quantity
+        for i, qty in enumerate(quantity.tolist()):
+            if qty == 0 or (is_open and 0 <= qty < 1):
+                continue
+            applied[i] = True
+            net_quantity += qty
+            is_open = net_quantity != 0
+        return applied
+
+    def _transact_asset_batch(
+        self, asset, rows, quantity, price, commission, dts
+    ):
+        """
+        Apply a batch of transactions in a single asset to its
+        Position, opening or removing the Position as necessary.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol of the transactions.
+        rows : `np.ndarray`
+            The rows of the transactions within the overall batch.
+        quantity : `np.ndarray`
+            The transaction quantities, in execution order.
+        price : `np.ndarray`
+            The transaction prices, in execution order.
+        commission : `np.ndarray`
+            The transaction commissions, in execution order.
+        dts : `list[pd.Timestamp]`
+            The transaction times, in execution order.
+
+        Returns
+        -------
+        `int` or `None`
+            The batch row of the transaction that opened the Position,
+            if it was opened by this batch and remains open.
+        """
+        position = self.positions.get(asset)
+        start_quantity = 0 if position is None else position.net_quantity
+        applied = self._applied_rows(
+            quantity, position is not None, start_quantity
+        )
+        if not applied.all():
+            rows = rows[applied]
+            quantity = quantity[applied]
+            price = price[applied]
+            commission = commission[applied]
+            dts = [dt for dt, a in zip(dts, applied) if a]
+        if len(quantity) == 0:
+            return None
+
+        if np.isnan(quantity).any():
+            raise ValueError(
+                'Transaction quantity of asset "%s" must be a number '
+                'to update the position.' % asset
+            )
+
+        invalid = np.flatnonzero(price <= 0.0)
+        if len(invalid) > 0:
+            raise ValueError(
+                'Market price "%s" of asset "%s" must be positive to '
+                'update the position.' % (price[invalid[0]], asset)
+            )
+
+        # Check the datetimes are in order as int64 nanoseconds
+        last_dt = dts[-1]
+        if position is not None:
+            dts = [position.current_dt] + dts
+        earlier = np.flatnonzero(
+            np.diff(pd.to_datetime(dts, utc=True).asi8) < 0
+        )
+        if len(earlier) > 0:
+            raise ValueError(
+                'Supplied update time of "%s" is earlier than '
+                'the current time of "%s".' % (
+                    dts[earlier[0] + 1], dts[earlier[0]]
+                )
+            )
+
+        # A Position is removed each time it becomes flat, so only the
+        # transactions after the last flat point affect the final state
+        open_row = None
+        flat = np.flatnonzero(start_quantity + np.cumsum(quantity) == 0)
+        if len(flat) > 0:
+            if flat[-1] == len(quantity) - 1:
+                self.positions.pop(asset, None)
+                return None
+            position = None
+            rows = rows[flat[-1] + 1:]
+            quantity = quantity[flat[-1] + 1:]
+            price = price[flat[-1] + 1:]
+            commission = commission[flat[-1] + 1:]
+
+        if position is None:
+            self.positions.pop(asset, None)
+            position = Position(
+                asset, 0.0, last_dt, 0, 0, 0.0, 0.0, 0.0, 0.0
+            )
+            self.positions[asset] = position
+            open_row = int(rows[0])
+
+        # The legs are aggregated in float64 since float32 only holds
+        # around seven significant digits, which loses cents on any
+        # consideration above $100,000
+        buys = quantity > 0
+        sells = ~buys
+        buy_quantity = quantity[buys].sum()
+        sell_quantity = -quantity[sells].sum()
+
+        if buy_quantity > 0:
+            total_buy_quantity = position.buy_quantity + buy_quantity
+            position.avg_bought = float(
+                (
+                    position.avg_bought * position.buy_quantity +
+                    np.dot(quantity[buys], price[buys])
+                ) / total_buy_quantity
+            )
+            position.buy_quantity = total_buy_quantity.item()
+            position.buy_commission += float(commission[buys].sum())
+
+        if sell_quantity > 0:
+            total_sell_quantity = position.sell_quantity + sell_quantity
+            position.avg_sold = float(
+                (
+                    position.avg_sold * position.sell_quantity -
+                    np.dot(quantity[sells], price[sells])
+                ) / total_sell_quantity
+            )
+            position.sell_quantity = total_sell_quantity.item()
+            position.sell_commission += float(commission[sells].sum())
+
+        # Also invalidates the cached values derived from the legs
+        position.update_current_price(float(price[-1]), last_dt)
+        return open_row
+
+    def update_current_price(self, asset, market_price, dt=None):
+        """
+        Updates the current market price of the asset's Position,
+        with an optional timestamp.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol of the Position to update.
+        market_price : `float`
+            The current market price.
+        dt : `pd.Timestamp`, optional
+            The optional timestamp of the current market price.
+        """
+        self._totals.clear()
+        self.positions[asset].update_current_price(market_price, dt)
+
+    def _total(self, attr):
+        """
+        Calculate the sum of the provided attribute across all
+        positions, caching the result until the positions are
+        next modified.
+
+        Parameters
+        ----------
+        attr : `str`
+            The Position attribute to sum.
+
+        Returns
+        -------
+        `float`
+            The sum of the attribute across all positions.
+        """
+        try:
+            return self._totals[attr]
+        except KeyError:
+            total = float(
+                np.fromiter(
+                    (getattr(pos, attr) for pos in self.positions.values()),
+                    dtype=np.float64, count=len(self.positions)
+                ).sum()
+            )
+            self._totals[attr] = total
+            return total
+
     def total_market_value(self):
         """
         Calculate the sum of all the positions' market values.
         """
-        return sum(
-            pos.market_value
-            for asset, pos in self.positions.items()
-        )
+        return self._total('market_value')
 
     def total_unrealised_pnl(self):
         """
         Calculate the sum of all the positions' unrealised P&Ls.
         """
-        return sum(
-            pos.unrealised_pnl
-            for asset, pos in self.positions.items()
-        )
+        return self._total('unrealised_pnl')
 
     def total_realised_pnl(self):
         """
         Calculate the sum of all the positions' realised P&Ls.
         """
-        return sum(
-            pos.realised_pnl
-            for asset, pos in self.positions.items()
-        )
+        return self._total('realised_pnl')
 
     def total_pnl(self):
         """
         Calculate the sum of all the positions' P&Ls.
         """
-        return sum(
-            pos.total_pnl
-            for asset, pos in self.positions.items()
-        )
+        return self._total('total_pnl')
@@ -160,10 +160,7 @@ class SimulatedBroker(Broker):
             The mapping of cash currency strings to
             amount stored by broker in local currency.
         """
-        cash_dict = dict(
-            (currency, 0.0)
-            for currency in settings.SUPPORTED['CURRENCIES']
-        )
+        cash_dict = dict.fromkeys(settings.SUPPORTED['CURRENCIES'], 0.0)
         if self.initial_funds > 0.0:
             cash_dict[self.base_currency] = self.initial_funds
         return cash_dict
@@ -1,4 +1,4 @@
-import numpy as np
+from math import copysign
 
 
 class Transaction(object):
@@ -22,6 +22,16 @@ class Transaction(object):
         The trading commission
     """
 
+    __slots__ = (
+        'asset',
+        'quantity',
+        'direction',
+        'dt',
+        'price',
+        'order_id',
+        'commission'
+    )
+
     def __init__(
         self,
         asset,
@@ -33,7 +43,7 @@ class Transaction(object):
     ):
         self.asset = asset
         self.quantity = quantity
-        self.direction = np.copysign(1, self.quantity)
+        self.direction = copysign(1, self.quantity)
         self.dt = dt
         self.price = price
         self.order_id = order_id
@@ -43,6 +43,21 @@ class Order(object):
         self.direction = np.copysign(1, self.quantity)
         self.order_id = self._set_or_generate_order_id(order_id)
 
+    def _order_attribs(self):
+        """
+        Collects all attributes of the Order with the exception
+        of the order ID.
+
+        Returns
+        -------
+        `tuple`
+            The non-order ID attributes of the Order.
+        """
+        return (
+            self.created_dt, self.cur_dt, self.asset,
+            self.quantity, self.commission, self.direction
+        )
+
     def _order_attribs_equal(self, other):
         """
         Asserts whether all attributes of the Order are equal
@@ -60,19 +75,7 @@ class Order(object):
         `Boolean`
             Whether the non-order ID attributes are equal.
         """
-        if self.created_dt != other.created_dt:
-            return False
-        if self.cur_dt != other.cur_dt:
-            return False
-        if self.asset != other.asset:
-            return False
-        if self.quantity != other.quantity:
-            return False
-        if self.commission != other.commission:
-            return False
-        if self.direction != other.direction:
-            return False
-        return True
+        return self._order_attribs() == other._order_attribs()
 
     def __repr__(self):
         """
@@ -184,12 +184,12 @@ class PortfolioConstructionModel(object):
                 current_portfolio[asset] = {"quantity": 0}
 
         # Set all assets from the current portfolio that
-        # aren't in the target portfolio (and aren't cash) to
-        # zero quantity within the target portfolio
+        # aren't in the target portfolio to zero quantity
+        # within the target portfolio. The broker portfolio
+        # dictionary excludes cash, so only assets remain
         for asset in current_portfolio:
-            if type(asset) != str:
-                if asset not in target_portfolio:
-                    target_portfolio[asset] = {"quantity": 0}
+            if asset not in target_portfolio:
+                target_portfolio[asset] = {"quantity": 0}
 
         # Iterate through the asset list and create the difference
         # quantities required for each asset
@@ -1,7 +1,7 @@
 SUPPORTED = {
-    'CURRENCIES': [
+    'CURRENCIES': (
         'USD', 'GBP', 'EUR'
-    ],
+    ),
     'FEE_MODEL': {
         'ZeroFeeModel': 'qstrader.broker.fee_model.zero_fee_model'
     }
@@ -91,34 +91,78 @@ class AssetPriceBuffers(object):
         else:
             self.prices.update(self._create_single_asset_prices_buffer_dict(asset))
 
-    def append(self, asset, price):
+    def _checked_asset_buffers(self, asset, prices):
         """
-        Append a new price onto the price deque for
-        the specific asset provided.
+        Check that the prices to be appended for the specific asset
+        provided are all positive and obtain its price deques.
+
+        The asset may have been added to the universe subsequent
+        to the beginning of the backtest and as such needs newly
+        created pricing buffers.
 
         Parameters
         ----------
         asset : `str`
             The asset symbol name.
-        price : `float`
-            The new price of the asset.
+        prices : `list[float]`
+            The new prices of the asset.
+
+        Returns
+        -------
+        `list[deque[float]]`
+            The price deques of the asset for each lookback.
         """
-        if price <= 0.0:
-            raise ValueError(
-                'Unable to append non-positive price of "%0.2f" '
-                'to metrics buffer for Asset "%s".' % (price, asset)
-            )
+        for price in prices:
+            if price <= 0.0:
+                raise ValueError(
+                    'Unable to append non-positive price of "%0.2f" '
+                    'to metrics buffer for Asset "%s".' % (price, asset)
+                )
 
-        # The asset may have been added to the universe subsequent
-        # to the beginning of the backtest and as such needs a
-        # newly created pricing buffer
         asset_lookback_key = AssetPriceBuffers._asset_lookback_key(asset, self.lookbacks[0])
         if asset_lookback_key not in self.prices:
             self.prices.update(self._create_single_asset_prices_buffer_dict(asset))
 
-        for lookback in self.lookbacks:
+        return [
             self.prices[
                 AssetPriceBuffers._asset_lookback_key(
                     asset, lookback
                 )
-            ].append(price)
+            ]
+            for lookback in self.lookbacks
+        ]
+
+    def append(self, asset, price):
+        """
+        Append a new price onto the price deque for
+        the specific asset provided.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        price : `float`
+            The new price of the asset.
+        """
+        for buffer in self._checked_asset_buffers(asset, (price,)):
+            buffer.append(price)
+
+    def extend(self, asset, prices):
+        """
+        Append a sequence of new prices onto the price deques
+        for the specific asset provided, in the order given.
+
+        Each deque is extended in a single call, which is
+        equivalent to, but faster than, appending the prices
+        one at a time.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        prices : `iterable[float]`
+            The new prices of the asset, oldest first.
+        """
+        prices = list(prices)
+        for buffer in self._checked_asset_buffers(asset, prices):
+            buffer.extend(prices)
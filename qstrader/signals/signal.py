@@ -54,6 +54,20 @@ class Signal(object):
         """
         self.buffers.append(asset, price)
 
+    def extend(self, asset, prices):
+        """
+        Append a sequence of new prices onto the price buffer
+        for the specific asset provided, in the order given.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        prices : `iterable[float]`
+            The new prices of the asset, oldest first.
+        """
+        self.buffers.extend(asset, prices)
+
     def update_assets(self, dt):
         """
         Ensure that any new additions to the universe also receive
@@ -1,7 +1,29 @@
+import functools
+
+import pandas as pd
 import pytest
 
 
 class Helpers:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def utc_timestamp(dt_str):
+        """
+        Parse a UTC Timestamp from a string, caching the result
+        so that each datetime string is only parsed once.
+
+        Parameters
+        ----------
+        dt_str : `str`
+            The datetime string to parse.
+
+        Returns
+        -------
+        `pd.Timestamp`
+            The UTC Timestamp.
+        """
+        return pd.Timestamp(dt_str, tz='UTC')
+
     @staticmethod
     def assert_order_lists_equal(orders_1, orders_2):
         """
@@ -16,8 +38,11 @@ class Helpers:
         orders_2 : `List[Order]`
             The second order list.
         """
-        for order_1, order_2 in zip(orders_1, orders_2):
-            assert order_1._order_attribs_equal(order_2)
+        assert len(orders_1) == len(orders_2)
+        assert (
+            [order._order_attribs() for order in orders_1] ==
+            [order._order_attribs() for order in orders_2]
+        )
 
 
 @pytest.fixture
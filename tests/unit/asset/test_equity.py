@@ -0,0 +1,36 @@
+import copy
+import pickle
+
+import pytest
+
+from qstrader.asset.equity import Equity
+
+
+@pytest.mark.parametrize(
+    'args,expected_repr',
+    [
+        (
+            ('Apple, Inc.', 'AAPL'),
+            "Equity(name='Apple, Inc.', symbol='AAPL', tax_exempt=True)"
+        ),
+        (
+            ('Microsoft, Inc.', 'MSFT', False),
+            "Equity(name='Microsoft, Inc.', symbol='MSFT', tax_exempt=False)"
+        )
+    ]
+)
+def test_equity(args, expected_repr):
+    """
+    Tests that the Equity asset is correctly instantiated
+    and survives copying and pickling.
+    """
+    equity = Equity(*args)
+
+    assert not equity.cash_like
+    assert repr(equity) == expected_repr
+    for other in (
+        copy.copy(equity),
+        copy.deepcopy(equity),
+        pickle.loads(pickle.dumps(equity))
+    ):
+        assert repr(other) == expected_repr
@@ -1,170 +1,226 @@
+import math
+
 import pandas as pd
-import pytz
 import pytest
 
 from qstrader.broker.portfolio.portfolio import Portfolio
-from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
 from qstrader.broker.transaction.transaction import Transaction
 
 
-def test_initial_settings_for_default_portfolio():
+START_DT = pd.Timestamp('2017-10-05 08:00:00', tz='UTC')
+EARLIER_DT = pd.Timestamp('2017-10-04 08:00:00', tz='UTC')
+LATER_DT = pd.Timestamp('2017-10-06 08:00:00', tz='UTC')
+EVEN_LATER_DT = pd.Timestamp('2017-10-07 08:00:00', tz='UTC')
+
+# Columns of an empty 'history_to_df' DataFrame, once
+# 'date' has been moved into the index
+EMPTY_HISTORY_COLUMNS = frozenset(
+    ["type", "description", "debit", "credit", "balance"]
+)
+
+
+# Keyword arguments of the 'EQ:AAA' Transaction used as a
+# template by most tests, which override individual fields
+TXN_TEMPLATE_KWARGS = {
+    'asset': 'EQ:AAA',
+    'quantity': 100,
+    'dt': LATER_DT,
+    'price': 567.0,
+    'order_id': 1,
+    'commission': 15.78
+}
+
+
+def make_transaction(**overrides):
+    """
+    Create a Transaction from the template keyword arguments,
+    replacing any fields supplied in 'overrides'.
+    """
+    return Transaction(**{**TXN_TEMPLATE_KWARGS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def default_portfolio():
+    """
+    An unfunded Portfolio with the default settings.
+    """
+    return Portfolio(START_DT)
+
+
+@pytest.fixture(scope="module", params=["USD", "GBP"])
+def currency(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def currency_portfolio(currency):
+    return Portfolio(START_DT, currency=currency)
+
+
+@pytest.fixture
+def funded_port_with_aaa():
+    """
+    A funded Portfolio holding a long position of 100 'EQ:AAA',
+    transacted one day after the Portfolio start date.
+    """
+    port = Portfolio(START_DT)
+    port.subscribe_funds(LATER_DT, 100000.0)
+    port.transact_asset(make_transaction())
+    return port
+
+
+def history_fields(port):
+    """
+    Reduce the Portfolio event history to tuples of primitive
+    fields, avoiding the construction of PortfolioEvent
+    instances purely for equality comparison.
+    """
+    return [
+        (pe.dt, pe.type, pe.description, pe.debit, pe.credit, pe.balance)
+        for pe in port.history
+    ]
+
+
+def portfolio_settings(port):
+    """
+    Collect the Portfolio settings into a single tuple so that
+    they can be checked with one comparison.
+    """
+    return (
+        port.start_dt, port.current_dt, port.currency,
+        port.starting_cash, port.portfolio_id, port.name,
+        port.total_market_value, port.cash, port.total_equity
+    )
+
+
+def subscription_event(dt, credit, balance):
+    """
+    Expected history fields for a subscription PortfolioEvent.
+    """
+    return (dt, 'subscription', 'SUBSCRIPTION', 0.0, credit, balance)
+
+
+def withdrawal_event(dt, debit, balance):
+    """
+    Expected history fields for a withdrawal PortfolioEvent.
+    """
+    return (dt, 'withdrawal', 'WITHDRAWAL', debit, 0.0, balance)
+
+
+def transaction_event(dt, description, debit, credit, balance):
+    """
+    Expected history fields for an asset transaction PortfolioEvent.
+    """
+    return (dt, 'asset_transaction', description, debit, credit, balance)
+
+
+def test_initial_settings_for_default_portfolio(default_portfolio):
     """
     Test that the initial settings are as they should be
     for two specified portfolios.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-
     # Test a default Portfolio
-    port1 = Portfolio(start_dt)
-    assert port1.start_dt == start_dt
-    assert port1.current_dt == start_dt
-    assert port1.currency == "USD"
-    assert port1.starting_cash == 0.0
-    assert port1.portfolio_id is None
-    assert port1.name is None
-    assert port1.total_market_value == 0.0
-    assert port1.cash == 0.0
-    assert port1.total_equity == 0.0
+    port1 = default_portfolio
+    assert portfolio_settings(port1) == (
+        START_DT, START_DT, "USD", 0.0, None, None, 0.0, 0.0, 0.0
+    )
 
     # Test a Portfolio with keyword arguments
     port2 = Portfolio(
-        start_dt, starting_cash=1234567.56, currency="USD",
+        START_DT, starting_cash=1234567.56, currency="USD",
         portfolio_id=12345, name="My Second Test Portfolio"
     )
-    assert port2.start_dt == start_dt
-    assert port2.current_dt == start_dt
-    assert port2.currency == "USD"
-    assert port2.starting_cash == 1234567.56
-    assert port2.portfolio_id == 12345
-    assert port2.name == "My Second Test Portfolio"
-    assert port2.total_equity == 1234567.56
-    assert port2.total_market_value == 0.0
-    assert port2.cash == 1234567.56
+    assert portfolio_settings(port2) == (
+        START_DT, START_DT, "USD", 1234567.56, 12345,
+        "My Second Test Portfolio", 0.0, 1234567.56, 1234567.56
+    )
 
 
-def test_portfolio_currency_settings():
+def test_portfolio_currency_settings(currency, currency_portfolio):
     """
     Test that USD and GBP currencies are correctly set with
-    some currency keyword arguments and that the currency
-    formatter produces the correct strings.
+    some currency keyword arguments.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    assert currency_portfolio.currency == currency
 
-    # Test a US portfolio produces correct values
-    cur1 = "USD"
-    port1 = Portfolio(start_dt, currency=cur1)
-    assert port1.currency == "USD"
 
-    # Test a UK portfolio produces correct values
-    cur2 = "GBP"
-    port2 = Portfolio(start_dt, currency=cur2)
-    assert port2.currency == "GBP"
+@pytest.mark.parametrize(
+    'dt,amount',
+    [
+        (EARLIER_DT, 1000.0),  # Incorrect datetime
+        (START_DT, -1000.0),  # Negative amount
+    ]
+)
+def test_subscribe_funds_raises(dt, amount):
+    """
+    Test subscribe_funds raises for incorrect datetime
+    and for negative amount.
+    """
+    port = Portfolio(START_DT, starting_cash=2000.0)
+    with pytest.raises(ValueError):
+        port.subscribe_funds(dt, amount)
 
 
 def test_subscribe_funds_behaviour():
     """
-    Test subscribe_funds raises for incorrect datetime
-    Test subscribe_funds raises for negative amount
     Test subscribe_funds correctly adds positive
     amount, generates correct event and modifies time
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    earlier_dt = pd.Timestamp('2017-10-04 08:00:00', tz=pytz.UTC)
-    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
-    pos_cash = 1000.0
-    neg_cash = -1000.0
-    port = Portfolio(start_dt, starting_cash=2000.0)
-
-    # Test subscribe_funds raises for incorrect datetime
-    with pytest.raises(ValueError):
-        port.subscribe_funds(earlier_dt, pos_cash)
-
-    # Test subscribe_funds raises for negative amount
-    with pytest.raises(ValueError):
-        port.subscribe_funds(start_dt, neg_cash)
-
-    # Test subscribe_funds correctly adds positive
-    # amount, generates correct event and modifies time
-    port.subscribe_funds(later_dt, pos_cash)
+    port = Portfolio(START_DT, starting_cash=2000.0)
+    port.subscribe_funds(LATER_DT, 1000.0)
 
     assert port.cash == 3000.0
     assert port.total_market_value == 0.0
     assert port.total_equity == 3000.0
 
-    pe1 = PortfolioEvent(
-        dt=start_dt, type='subscription',
-        description="SUBSCRIPTION", debit=0.0,
-        credit=2000.0, balance=2000.0
-    )
-    pe2 = PortfolioEvent(
-        dt=later_dt, type='subscription',
-        description="SUBSCRIPTION", debit=0.0,
-        credit=1000.0, balance=3000.0
-    )
-
-    assert port.history == [pe1, pe2]
-    assert port.current_dt == later_dt
+    assert history_fields(port) == [
+        subscription_event(START_DT, 2000.0, 2000.0),
+        subscription_event(LATER_DT, 1000.0, 3000.0)
+    ]
+    assert port.current_dt == LATER_DT
+
+
+@pytest.mark.parametrize(
+    'dt,amount',
+    [
+        (EARLIER_DT, 500.0),  # Incorrect datetime
+        (START_DT, -500.0),  # Negative amount
+        (LATER_DT, 2000.0),  # Not enough cash
+    ]
+)
+def test_withdraw_funds_raises(dt, amount):
+    """
+    Test withdraw_funds raises for incorrect datetime,
+    for negative amount and for lack of cash.
+    """
+    port = Portfolio(START_DT, starting_cash=1000.0)
+    with pytest.raises(ValueError):
+        port.withdraw_funds(dt, amount)
 
 
 def test_withdraw_funds_behaviour():
     """
-    Test withdraw_funds raises for incorrect datetime
-    Test withdraw_funds raises for negative amount
-    Test withdraw_funds raises for lack of cash
     Test withdraw_funds correctly subtracts positive
     amount, generates correct event and modifies time
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    earlier_dt = pd.Timestamp('2017-10-04 08:00:00', tz=pytz.UTC)
-    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
-    even_later_dt = pd.Timestamp('2017-10-07 08:00:00', tz=pytz.UTC)
-    pos_cash = 1000.0
-    neg_cash = -1000.0
-    port_raise = Portfolio(start_dt)
-
-    # Test withdraw_funds raises for incorrect datetime
-    with pytest.raises(ValueError):
-        port_raise.withdraw_funds(earlier_dt, pos_cash)
-
-    # Test withdraw_funds raises for negative amount
-    with pytest.raises(ValueError):
-        port_raise.withdraw_funds(start_dt, neg_cash)
-
-    # Test withdraw_funds raises for not enough cash
-    port_broke = Portfolio(start_dt)
-    port_broke.subscribe_funds(later_dt, 1000.0)
-
-    with pytest.raises(ValueError):
-        port_broke.withdraw_funds(later_dt, 2000.0)
-
-    # Test withdraw_funds correctly subtracts positive
-    # amount, generates correct event and modifies time
     # Initial subscribe
-    port_cor = Portfolio(start_dt)
-    port_cor.subscribe_funds(later_dt, pos_cash)
-    pe_sub = PortfolioEvent(
-        dt=later_dt, type='subscription',
-        description="SUBSCRIPTION", debit=0.0,
-        credit=1000.0, balance=1000.0
-    )
-    assert port_cor.cash == 1000.0
-    assert port_cor.total_market_value == 0.0
-    assert port_cor.total_equity == 1000.0
-    assert port_cor.history == [pe_sub]
-    assert port_cor.current_dt == later_dt
+    port = Portfolio(START_DT)
+    port.subscribe_funds(LATER_DT, 1000.0)
+    pe_sub = subscription_event(LATER_DT, 1000.0, 1000.0)
+    assert port.cash == 1000.0
+    assert port.total_market_value == 0.0
+    assert port.total_equity == 1000.0
+    assert history_fields(port) == [pe_sub]
+    assert port.current_dt == LATER_DT
 
     # Now withdraw
-    port_cor.withdraw_funds(even_later_dt, 468.0)
-    pe_wdr = PortfolioEvent(
-        dt=even_later_dt, type='withdrawal',
-        description="WITHDRAWAL", debit=468.0,
-        credit=0.0, balance=532.0
-    )
-    assert port_cor.cash == 532.0
-    assert port_cor.total_market_value == 0.0
-    assert port_cor.total_equity == 532.0
-    assert port_cor.history == [pe_sub, pe_wdr]
-    assert port_cor.current_dt == even_later_dt
+    port.withdraw_funds(EVEN_LATER_DT, 468.0)
+    pe_wdr = withdrawal_event(EVEN_LATER_DT, 468.0, 532.0)
+    assert port.cash == 532.0
+    assert port.total_market_value == 0.0
+    assert port.total_equity == 532.0
+    assert history_fields(port) == [pe_sub, pe_wdr]
+    assert port.current_dt == EVEN_LATER_DT
 
 
 def test_transact_asset_behaviour():
@@ -174,61 +230,34 @@ def test_transact_asset_behaviour():
     for correct transaction (commission etc), correct
     portfolio event and correct time update
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    earlier_dt = pd.Timestamp('2017-10-04 08:00:00', tz=pytz.UTC)
-    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
-    even_later_dt = pd.Timestamp('2017-10-07 08:00:00', tz=pytz.UTC)
-    port = Portfolio(start_dt)
-    asset = 'EQ:AAA'
+    port = Portfolio(START_DT)
 
     # Test transact_asset raises for incorrect time
-    tn_early = Transaction(
-        asset=asset,
-        quantity=100,
-        dt=earlier_dt,
-        price=567.0,
-        order_id=1,
-        commission=0.0
-    )
+    tn_early = make_transaction(dt=EARLIER_DT, commission=0.0)
     with pytest.raises(ValueError):
         port.transact_asset(tn_early)
 
     # Test transact_asset raises for transaction total
     # cost exceeding total cash
-    port.subscribe_funds(later_dt, 1000.0)
+    port.subscribe_funds(LATER_DT, 1000.0)
 
     assert port.cash == 1000.0
     assert port.total_market_value == 0.0
     assert port.total_equity == 1000.0
 
-    pe_sub1 = PortfolioEvent(
-        dt=later_dt, type='subscription',
-        description="SUBSCRIPTION", debit=0.0,
-        credit=1000.0, balance=1000.0
-    )
+    pe_sub1 = subscription_event(LATER_DT, 1000.0, 1000.0)
 
     # Test correct total_cash and total_securities_value
     # for correct transaction (commission etc), correct
     # portfolio event and correct time update
-    port.subscribe_funds(even_later_dt, 99000.0)
+    port.subscribe_funds(EVEN_LATER_DT, 99000.0)
 
     assert port.cash == 100000.0
     assert port.total_market_value == 0.0
     assert port.total_equity == 100000.0
 
-    pe_sub2 = PortfolioEvent(
-        dt=even_later_dt, type='subscription',
-        description="SUBSCRIPTION", debit=0.0,
-        credit=99000.0, balance=100000.0
-    )
-    tn_even_later = Transaction(
-        asset=asset,
-        quantity=100,
-        dt=even_later_dt,
-        price=567.0,
-        order_id=1,
-        commission=15.78
-    )
+    pe_sub2 = subscription_event(EVEN_LATER_DT, 99000.0, 100000.0)
+    tn_even_later = make_transaction(dt=EVEN_LATER_DT)
     port.transact_asset(tn_even_later)
 
     assert port.cash == 43284.22
@@ -236,48 +265,33 @@ def test_transact_asset_behaviour():
     assert port.total_equity == 99984.22
 
     description = "LONG 100 EQ:AAA 567.00 07/10/2017"
-    pe_tn = PortfolioEvent(
-        dt=even_later_dt, type="asset_transaction",
-        description=description, debit=56715.78,
-        credit=0.0, balance=43284.22
+    pe_tn = transaction_event(
+        EVEN_LATER_DT, description, 56715.78, 0.0, 43284.22
     )
 
-    assert port.history == [pe_sub1, pe_sub2, pe_tn]
-    assert port.current_dt == even_later_dt
+    assert history_fields(port) == [pe_sub1, pe_sub2, pe_tn]
+    assert port.current_dt == EVEN_LATER_DT
 
 
-def test_portfolio_to_dict_empty_portfolio():
+def test_portfolio_to_dict_empty_portfolio(default_portfolio):
     """
     Test 'portfolio_to_dict' method for an empty Portfolio.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    port = Portfolio(start_dt)
-    port.subscribe_funds(start_dt, 100000.0)
-    port_dict = port.portfolio_to_dict()
+    port_dict = default_portfolio.portfolio_to_dict()
     assert port_dict == {}
 
 
-def test_portfolio_to_dict_for_two_holdings():
+def test_portfolio_to_dict_for_two_holdings(funded_port_with_aaa):
     """
     Test portfolio_to_dict for two holdings.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    asset1_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
-    asset2_dt = pd.Timestamp('2017-10-07 08:00:00', tz=pytz.UTC)
-    update_dt = pd.Timestamp('2017-10-08 08:00:00', tz=pytz.UTC)
+    update_dt = pd.Timestamp('2017-10-08 08:00:00', tz='UTC')
     asset1 = 'EQ:AAA'
     asset2 = 'EQ:BBB'
 
-    port = Portfolio(start_dt, portfolio_id='1234')
-    port.subscribe_funds(start_dt, 100000.0)
-    tn_asset1 = Transaction(
-        asset=asset1, quantity=100, dt=asset1_dt,
-        price=567.0, order_id=1, commission=15.78
-    )
-    port.transact_asset(tn_asset1)
-
-    tn_asset2 = Transaction(
-        asset=asset2, quantity=100, dt=asset2_dt,
+    port = funded_port_with_aaa
+    tn_asset2 = make_transaction(
+        asset=asset2, dt=EVEN_LATER_DT,
         price=123.0, order_id=2, commission=7.64
     )
     port.transact_asset(tn_asset2)
@@ -303,94 +317,51 @@ def test_portfolio_to_dict_for_two_holdings():
     # This is needed because we're not using Decimal
     # datatypes and have to compare slightly differing
     # floating point representations
-    for asset in (asset1, asset2):
-        for key, val in test_holdings[asset].items():
-            assert port_holdings[asset][key] == pytest.approx(
-                test_holdings[asset][key]
-            )
+    for asset, expected in test_holdings.items():
+        holding = port_holdings[asset]
+        assert all(
+            math.isclose(holding[key], val, rel_tol=1e-9, abs_tol=1e-9)
+            for key, val in expected.items()
+        ), (asset, holding, expected)
 
 
-def test_update_market_value_of_asset_not_in_list():
+def test_update_market_value_of_asset_not_in_list(default_portfolio):
     """
     Test update_market_value_of_asset for asset not in list.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
-    port = Portfolio(start_dt)
     asset = 'EQ:AAA'
-    update = port.update_market_value_of_asset(
-        asset, 54.34, later_dt
+    update = default_portfolio.update_market_value_of_asset(
+        asset, 54.34, LATER_DT
     )
     assert update is None
 
 
-def test_update_market_value_of_asset_negative_price():
+def test_update_market_value_of_asset_negative_price(funded_port_with_aaa):
     """
     Test update_market_value_of_asset for
     asset with negative price.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
-    port = Portfolio(start_dt)
-
-    asset = 'EQ:AAA'
-    port.subscribe_funds(later_dt, 100000.0)
-    tn_asset = Transaction(
-        asset=asset,
-        quantity=100,
-        dt=later_dt,
-        price=567.0,
-        order_id=1,
-        commission=15.78
-    )
-    port.transact_asset(tn_asset)
     with pytest.raises(ValueError):
-        port.update_market_value_of_asset(
-            asset, -54.34, later_dt
+        funded_port_with_aaa.update_market_value_of_asset(
+            'EQ:AAA', -54.34, LATER_DT
         )
 
 
-def test_update_market_value_of_asset_earlier_date():
+def test_update_market_value_of_asset_earlier_date(funded_port_with_aaa):
     """
     Test update_market_value_of_asset for asset
     with current_trade_date in past
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    earlier_dt = pd.Timestamp('2017-10-04 08:00:00', tz=pytz.UTC)
-    later_dt = pd.Timestamp('2017-10-06 08:00:00', tz=pytz.UTC)
-    port = Portfolio(start_dt, portfolio_id='1234')
-
-    asset = 'EQ:AAA'
-    port.subscribe_funds(later_dt, 100000.0)
-    tn_asset = Transaction(
-        asset=asset,
-        quantity=100,
-        dt=later_dt,
-        price=567.0,
-        order_id=1,
-        commission=15.78
-    )
-    port.transact_asset(tn_asset)
     with pytest.raises(ValueError):
-        port.update_market_value_of_asset(
-            asset, 50.23, earlier_dt
+        funded_port_with_aaa.update_market_value_of_asset(
+            'EQ:AAA', 50.23, EARLIER_DT
         )
 
 
-def test_history_to_df_empty():
+def test_history_to_df_empty(default_portfolio):
     """
     Test 'history_to_df' with no events.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    port = Portfolio(start_dt)
-    hist_df = port.history_to_df()
-    test_df = pd.DataFrame(
-        [], columns=[
-            "date", "type", "description",
-            "debit", "credit", "balance"
-        ]
-    )
-    test_df.set_index(keys=["date"], inplace=True)
-    assert sorted(test_df.columns) == sorted(hist_df.columns)
-    assert len(test_df) == len(hist_df)
+    hist_df = default_portfolio.history_to_df()
+    assert frozenset(hist_df.columns) == EMPTY_HISTORY_COLUMNS
     assert len(hist_df) == 0
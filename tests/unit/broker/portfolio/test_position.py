@@ -1,725 +1,521 @@
-import numpy as np
+import copy
+from datetime import timezone
+
 import pandas as pd
 import pytest
-import pytz
 
 from qstrader.broker.portfolio.position import Position
 from qstrader.broker.transaction.transaction import Transaction
 
 
-def test_basic_long_equities_position():
-    """
-    Tests that the properties on the Position
-    are calculated for a simple long equities position.
-    """
-    # Initial long details
-    asset = 'EQ:MSFT'
-    quantity = 100
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 193.74
-    order_id = 123
-    commission = 1.0
-
-    # Create the initial transaction and position
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
+ASSET_MSFT = 'EQ:MSFT'
+ASSET_AMZN = 'EQ:AMZN'
+ASSET_SPY = 'EQ:SPY'
+ASSET_TLT = 'EQ:TLT'
+ASSET_TSLA = 'EQ:TSLA'
+ASSET_AGG = 'EQ:AGG'
+ASSET_AAPL = 'EQ:AAPL'
+
+UTC = timezone.utc
+DT_15 = pd.Timestamp('2020-06-16 15:00:00', tz=UTC)
+DT_16 = pd.Timestamp('2020-06-16 16:00:00', tz=UTC)
+DT_17 = pd.Timestamp('2020-06-16 17:00:00', tz=UTC)
+DT_18 = pd.Timestamp('2020-06-16 18:00:00', tz=UTC)
+DTS = (DT_15, DT_16, DT_17, DT_18)
+
+# Opening long MSFT trade shared by several cases
+MSFT_LONG_OPEN = (100, 193.74, 123, 1.0)
+
+# Long, short, long and short trades, ending net long
+FOUR_LONG = [
+    (453, 312.96, 100, 1.95),
+    (-397, 315.599924, 101, 4.8),
+    (624, 312.96, 102, 2.68),
+    (-519, 315.78, 103, 6.28)
+]
+
+# Short, long, short and long trades, ending net short
+FOUR_SHORT = [
+    (-762, 117.74, 100, 5.35),
+    (477, 117.875597, 101, 2.31),
+    (-595, 117.74, 102, 4.18),
+    (427, 117.793115, 103, 2.06)
+]
+
+# Each case consists of an identifier, the asset symbol, the name of
+# a fixture providing the opened Position (or None to open it with the
+# first trade), the (quantity, price, order_id, commission) trades
+# carried out in sequence at DTS, an optional (market_price, dt) update
+# carried out after all trades and the expected Position properties
+# once complete, wrapped in pytest.approx where they are subject to
+# floating point error
+CASES = [
+    (
+        'basic_long_equities',
+        ASSET_MSFT,
+        'msft_long',
+        [],
+        (192.80, DT_16),
+        {
+            'buy_quantity': 100,
+            'sell_quantity': 0,
+            'avg_bought': 193.74,
+            'avg_sold': 0.0,
+            'commission': 1.0,
+            'direction': 1,
+            'market_value': 19280.0,
+            'avg_price': 193.75,
+            'net_quantity': 100,
+            'total_bought': 19374.0,
+            'total_sold': 0.0,
+            'net_total': -19374.0,
+            'net_incl_commission': -19375.0,
+            'unrealised_pnl': pytest.approx(-95.0),
+            'realised_pnl': pytest.approx(0.0)
+        }
+    ),
+    (
+        'long_twice',
+        ASSET_MSFT,
+        'msft_long',
+        [(60, 193.79, 234, 1.0)],
+        None,
+        {
+            'buy_quantity': 160,
+            'sell_quantity': 0,
+            'avg_bought': pytest.approx(193.75875),
+            'avg_sold': 0.0,
+            'commission': 2.0,
+            'direction': 1,
+            'market_value': pytest.approx(31006.40),
+            'avg_price': 193.77125,
+            'net_quantity': 160,
+            'total_bought': 31001.40,
+            'total_sold': 0.0,
+            'net_total': -31001.40,
+            'net_incl_commission': -31003.40,
+            'unrealised_pnl': pytest.approx(3.0),
+            'realised_pnl': pytest.approx(0.0)
+        }
+    ),
+    (
+        'long_close',
+        ASSET_AMZN,
+        None,
+        [
+            (100, 2615.27, 123, 1.0),
+            (-100, 2622.0, 234, 6.81)
+        ],
+        None,
+        {
+            'buy_quantity': 100,
+            'sell_quantity': 100,
+            'avg_bought': 2615.27,
+            'avg_sold': 2622.0,
+            'commission': 7.81,
+            'direction': 0,
+            'market_value': 0.0,
+            'avg_price': 0.0,
+            'net_quantity': 0,
+            'total_bought': 261527.0,
+            'total_sold': 262200.0,
+            'net_total': 673.0,
+            'net_incl_commission': 665.19,
+            'unrealised_pnl': 0.0,
+            'realised_pnl': 665.19
+        }
+    ),
+    (
+        'long_and_short',
+        ASSET_SPY,
+        None,
+        [
+            (100, 307.05, 123, 1.0),
+            (-60, 314.91, 234, 1.42)
+        ],
+        None,
+        {
+            'buy_quantity': 100,
+            'sell_quantity': 60,
+            'avg_bought': 307.05,
+            'avg_sold': 314.91,
+            'commission': 2.42,
+            'direction': 1,
+            'market_value': pytest.approx(12596.40),
+            'avg_price': 307.06,
+            'net_quantity': 40,
+            'total_bought': 30705.0,
+            'total_sold': pytest.approx(18894.60),
+            'net_total': pytest.approx(-11810.40),
+            'net_incl_commission': pytest.approx(-11812.82),
+            'unrealised_pnl': pytest.approx(314.0),
+            'realised_pnl': pytest.approx(469.58)
+        }
+    ),
+    (
+        'long_short_long_short_ending_long',
+        ASSET_SPY,
+        None,
+        FOUR_LONG,
+        None,
+        {
+            'buy_quantity': 1077,
+            'sell_quantity': 916,
+            'avg_bought': 312.96,
+            'avg_sold': 315.70195396069863,
+            'commission': 15.71,
+            'direction': 1,
+            'market_value': pytest.approx(50840.58),
+            'avg_price': 312.96429897864436,
+            'net_quantity': 161,
+            'total_bought': 337057.92,
+            'total_sold': pytest.approx(289182.99),
+            'net_total': pytest.approx(-47874.93),
+            'net_incl_commission': pytest.approx(-47890.64),
+            'unrealised_pnl': pytest.approx(453.327864438),
+            'realised_pnl': pytest.approx(2496.61)
+        }
+    ),
+    (
+        'basic_short_equities',
+        ASSET_TLT,
+        None,
+        [(-100, 162.39, 123, 1.37)],
+        (159.43, DT_16),
+        {
+            'buy_quantity': 0,
+            'sell_quantity': 100,
+            'avg_bought': 0.0,
+            'avg_sold': 162.39,
+            'commission': 1.37,
+            'direction': -1,
+            'market_value': -15943.0,
+            'avg_price': 162.3763,
+            'net_quantity': -100,
+            'total_bought': 0.0,
+            'total_sold': pytest.approx(16239.0),
+            'net_total': pytest.approx(16239.0),
+            'net_incl_commission': pytest.approx(16237.63),
+            'unrealised_pnl': pytest.approx(294.63),
+            'realised_pnl': pytest.approx(0.0)
+        }
+    ),
+    (
+        'short_twice',
+        ASSET_MSFT,
+        None,
+        [
+            (-100, 194.55, 123, 1.44),
+            (-60, 194.76, 234, 1.27)
+        ],
+        None,
+        {
+            'buy_quantity': 0,
+            'sell_quantity': 160,
+            'avg_bought': 0.0,
+            'avg_sold': 194.62875,
+            'commission': 2.71,
+            'direction': -1,
+            'market_value': pytest.approx(-31161.6),
+            'avg_price': pytest.approx(194.6118125),
+            'net_quantity': -160,
+            'total_bought': 0.0,
+            'total_sold': 31140.60,
+            'net_total': 31140.6,
+            'net_incl_commission': 31137.89,
+            'unrealised_pnl': pytest.approx(-23.71),
+            'realised_pnl': pytest.approx(0.0)
+        }
+    ),
+    (
+        'short_close',
+        ASSET_TSLA,
+        None,
+        [
+            (-100, 982.13, 123, 3.18),
+            (100, 982.13, 234, 1.0)
+        ],
+        None,
+        {
+            'buy_quantity': 100,
+            'sell_quantity': 100,
+            'avg_bought': 982.13,
+            'avg_sold': 982.13,
+            'commission': 4.18,
+            'direction': 0,
+            'market_value': 0.0,
+            'avg_price': 0.0,
+            'net_quantity': 0,
+            'total_bought': 98213.0,
+            'total_sold': 98213.0,
+            'net_total': 0.0,
+            'net_incl_commission': -4.18,
+            'unrealised_pnl': 0.0,
+            'realised_pnl': -4.18
+        }
+    ),
+    (
+        'short_and_long',
+        ASSET_TLT,
+        None,
+        [
+            (-100, 162.39, 123, 1.37),
+            (60, 159.99, 234, 1.0)
+        ],
+        None,
+        {
+            'buy_quantity': 60,
+            'sell_quantity': 100,
+            'avg_bought': pytest.approx(159.99),
+            'avg_sold': 162.39,
+            'commission': 2.37,
+            'direction': -1,
+            'market_value': pytest.approx(-6399.6),
+            'avg_price': 162.3763,
+            'net_quantity': -40,
+            'total_bought': pytest.approx(9599.40),
+            'total_sold': pytest.approx(16239.0),
+            'net_total': pytest.approx(6639.60),
+            'net_incl_commission': pytest.approx(6637.23),
+            'unrealised_pnl': pytest.approx(95.452),
+            'realised_pnl': pytest.approx(142.1779999999)
+        }
+    ),
+    (
+        'short_long_short_long_ending_short',
+        ASSET_AGG,
+        None,
+        FOUR_SHORT,
+        None,
+        {
+            'buy_quantity': 904,
+            'sell_quantity': 1357,
+            'avg_bought': 117.83663702876107,
+            'avg_sold': 117.74,
+            'commission': pytest.approx(13.90),
+            'direction': -1,
+            'market_value': pytest.approx(-53360.281095),
+            'avg_price': 117.73297715549005,
+            'net_quantity': -453,
+            'total_bought': 106524.31987400001,
+            'total_sold': pytest.approx(159773.18),
+            'net_total': pytest.approx(53248.86),
+            'net_incl_commission': pytest.approx(53234.95),
+            'unrealised_pnl': pytest.approx(-27.242443563),
+            'realised_pnl': pytest.approx(-98.0785254)
+        }
     )
-    position = Position.open_from_transaction(transaction)
+]
 
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
 
-    # Update the market price
-    new_market_price = 192.80
-    new_dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    position.update_current_price(new_market_price, new_dt)
-
-    assert position.current_price == new_market_price
-    assert position.current_dt == new_dt
-
-    assert position.buy_quantity == 100
-    assert position.sell_quantity == 0
-    assert position.avg_bought == 193.74
-    assert position.avg_sold == 0.0
-    assert position.commission == 1.0
-
-    assert position.direction == 1
-    assert position.market_value == 19280.0
-    assert position.avg_price == 193.75
-    assert position.net_quantity == 100
-    assert position.total_bought == 19374.0
-    assert position.total_sold == 0.0
-    assert position.net_total == -19374.0
-    assert position.net_incl_commission == -19375.0
-    assert np.isclose(position.unrealised_pnl, -95.0)
-    assert np.isclose(position.realised_pnl, 0.0)
-
-
-def test_position_long_twice():
+def check_position(position, expected):
     """
-    Tests that the properties on the Position
-    are calculated for two consective long trades
-    with differing quantities and market prices.
+    Checks the Position attributes named in 'expected'
+    against their expected values.
     """
-    # Initial long details
-    asset = 'EQ:MSFT'
-    quantity = 100
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 193.74
-    order_id = 123
-    commission = 1.0
-
-    # Create the initial transaction and position
-    first_transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position = Position.open_from_transaction(first_transaction)
-
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
-
-    # Second long
-    second_quantity = 60
-    second_dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    second_price = 193.79
-    second_order_id = 234
-    second_commission = 1.0
-    second_transaction = Transaction(
-        asset,
-        quantity=second_quantity,
-        dt=second_dt,
-        price=second_price,
-        order_id=second_order_id,
-        commission=second_commission
-    )
-    position.transact(second_transaction)
-
-    assert position.current_price == second_price
-    assert position.current_dt == second_dt
-
-    assert position.buy_quantity == 160
-    assert position.sell_quantity == 0
-    assert np.isclose(position.avg_bought, 193.75875)
-    assert position.avg_sold == 0.0
-    assert position.commission == 2.0
-
-    assert position.direction == 1
-    assert np.isclose(position.market_value, 31006.40)
-    assert position.avg_price == 193.77125
-    assert position.net_quantity == 160
-    assert position.total_bought == 31001.40
-    assert position.total_sold == 0.0
-    assert position.net_total == -31001.40
-    assert position.net_incl_commission == -31003.40
-    assert np.isclose(position.unrealised_pnl, 3.0)
-    assert np.isclose(position.realised_pnl, 0.0)
-
-
-def test_position_long_close():
+    assert {key: getattr(position, key) for key in expected} == expected
+
+
+def make_position(**txn_kwargs):
     """
-    Tests that the properties on the Position
-    are calculated for a long opening trade and
-    subsequent closing trade.
+    Opens a new Position from the provided
+    Transaction keyword arguments.
     """
-    # Initial long details
-    asset = 'EQ:AMZN'
-    quantity = 100
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 2615.27
-    order_id = 123
-    commission = 1.0
-
-    # Create the initial transaction and position
-    first_transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position = Position.open_from_transaction(first_transaction)
-
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
-
-    # Closing trade
-    second_quantity = -100
-    second_dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    second_price = 2622.0
-    second_order_id = 234
-    second_commission = 6.81
-    second_transaction = Transaction(
-        asset,
-        quantity=second_quantity,
-        dt=second_dt,
-        price=second_price,
-        order_id=second_order_id,
-        commission=second_commission
-    )
-    position.transact(second_transaction)
-
-    assert position.current_price == second_price
-    assert position.current_dt == second_dt
-
-    assert position.buy_quantity == 100
-    assert position.sell_quantity == 100
-    assert position.avg_bought == 2615.27
-    assert position.avg_sold == 2622.0
-    assert position.commission == 7.81
-
-    assert position.direction == 0
-    assert position.market_value == 0.0
-    assert position.avg_price == 0.0
-    assert position.net_quantity == 0
-    assert position.total_bought == 261527.0
-    assert position.total_sold == 262200.0
-    assert position.net_total == 673.0
-    assert position.net_incl_commission == 665.19
-    assert position.unrealised_pnl == 0.0
-    assert position.realised_pnl == 665.19
-
-
-def test_position_long_and_short():
+    return Position.open_from_transaction(Transaction(**txn_kwargs))
+
+
+def do_transact(position, **txn_kwargs):
     """
-    Tests that the properties on the Position
-    are calculated for a long trade followed by
-    a partial closing short trade with differing
-    market prices.
+    Transacts a Transaction built from the provided
+    keyword arguments on a Position.
     """
-    # Initial long details
-    asset = 'EQ:SPY'
-    quantity = 100
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 307.05
-    order_id = 123
-    commission = 1.0
-
-    # Create the initial transaction and position
-    first_transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position = Position.open_from_transaction(first_transaction)
-
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
-
-    # Short details and transaction
-    second_quantity = -60
-    second_dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    second_price = 314.91
-    second_order_id = 234
-    second_commission = 1.42
-    second_transaction = Transaction(
-        asset,
-        quantity=second_quantity,
-        dt=second_dt,
-        price=second_price,
-        order_id=second_order_id,
-        commission=second_commission
-    )
-    position.transact(second_transaction)
-
-    assert position.current_price == second_price
-    assert position.current_dt == second_dt
-
-    assert position.buy_quantity == 100
-    assert position.sell_quantity == 60
-    assert position.avg_bought == 307.05
-    assert position.avg_sold == 314.91
-    assert position.commission == 2.42
-
-    assert position.direction == 1
-    assert np.isclose(position.market_value, 12596.40)
-    assert position.avg_price == 307.06
-    assert position.net_quantity == 40
-    assert position.total_bought == 30705.0
-    assert np.isclose(position.total_sold, 18894.60)
-    assert np.isclose(position.net_total, -11810.40)
-    assert np.isclose(position.net_incl_commission, -11812.82)
-    assert np.isclose(position.unrealised_pnl, 314.0)
-    assert np.isclose(position.realised_pnl, 469.58)
-
-
-def test_position_long_short_long_short_ending_long():
+    position.transact(Transaction(**txn_kwargs))
+
+
+@pytest.fixture(scope="module")
+def msft_long_proto():
     """
-    Tests that the properties on the Position
-    are calculated for four trades consisting
-    of a long, short, long and short, net long
-    after all trades with varying quantities
-    and market prices.
+    Prototype long MSFT Position opened from MSFT_LONG_OPEN,
+    constructed once per module.
     """
-    # First trade (first long)
-    asset = 'EQ:SPY'
-    quantity = 453
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 312.96
-    order_id = 100
-    commission = 1.95
-
-    # Create the initial transaction and position
-    first_transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
+    quantity, price, order_id, commission = MSFT_LONG_OPEN
+    return Position.open_from_transaction(
+        Transaction(
+            ASSET_MSFT,
+            quantity=quantity,
+            dt=DT_15,
+            price=price,
+            order_id=order_id,
+            commission=commission
+        )
     )
-    position = Position.open_from_transaction(first_transaction)
-
-    # Second trade (first short)
-    quantity = -397
-    dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    price = 315.599924
-    order_id = 101
-    commission = 4.8
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position.transact(transaction)
-
-    # Third trade (second long)
-    quantity = 624
-    dt = pd.Timestamp('2020-06-16 17:00:00', tz=pytz.UTC)
-    price = 312.96
-    order_id = 102
-    commission = 2.68
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position.transact(transaction)
-
-    # Fourth trade (second short), now net long
-    quantity = -519
-    dt = pd.Timestamp('2020-06-16 18:00:00', tz=pytz.UTC)
-    price = 315.78
-    order_id = 103
-    commission = 6.28
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position.transact(transaction)
-
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
-
-    assert position.buy_quantity == 1077
-    assert position.sell_quantity == 916
-    assert position.avg_bought == 312.96
-    assert position.avg_sold == 315.70195396069863
-    assert position.commission == 15.71
-
-    assert position.direction == 1
-    assert np.isclose(position.market_value, 50840.58)
-    assert position.avg_price == 312.96429897864436
-    assert position.net_quantity == 161
-    assert position.total_bought == 337057.92
-    assert np.isclose(position.total_sold, 289182.99)
-    assert np.isclose(position.net_total, -47874.93)
-    assert np.isclose(position.net_incl_commission, -47890.64)
-    assert np.isclose(position.unrealised_pnl, 453.327864438)
-    assert np.isclose(position.realised_pnl, 2496.61)
-
-
-def test_basic_short_equities_position():
+
+
+@pytest.fixture
+def msft_long(msft_long_proto):
     """
-    Tests that the properties on the Position
-    are calculated for a simple short equities position.
+    A fresh copy of the long MSFT Position prototype.
     """
-    # Initial short details
-    asset = 'EQ:TLT'
-    quantity = -100
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 162.39
-    order_id = 123
-    commission = 1.37
-
-    # Create the initial transaction and position
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position = Position.open_from_transaction(transaction)
+    return copy.copy(msft_long_proto)
 
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
+
+@pytest.mark.parametrize(
+    'asset,start,trades,market_update,expected',
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES]
+)
+def test_position_scenario(
+    request, asset, start, trades, market_update, expected
+):
+    """
+    Tests that the properties on the Position are calculated
+    correctly after opening the Position, either with the first
+    trade or from the 'start' fixture opened at DT_15, applying
+    any subsequent trades and an optional market price update.
+    """
+    base_kwargs = {'asset': asset}
+    position = None
+    dts = DTS
+
+    if start is not None:
+        position = request.getfixturevalue(start)
+        dts = DTS[1:]
+
+        check_position(
+            position, {
+                'asset': asset,
+                'current_price': MSFT_LONG_OPEN[1],
+                'current_dt': DT_15
+            }
+        )
+
+    for dt, (quantity, price, order_id, commission) in zip(dts, trades):
+        txn_kwargs = {
+            **base_kwargs,
+            'quantity': quantity,
+            'dt': dt,
+            'price': price,
+            'order_id': order_id,
+            'commission': commission
+        }
+        if position is None:
+            position = make_position(**txn_kwargs)
+        else:
+            do_transact(position, **txn_kwargs)
+
+        check_position(
+            position, {
+                'asset': asset,
+                'current_price': txn_kwargs['price'],
+                'current_dt': dt
+            }
+        )
 
     # Update the market price
-    new_market_price = 159.43
-    new_dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    position.update_current_price(new_market_price, new_dt)
-
-    assert position.current_price == new_market_price
-    assert position.current_dt == new_dt
-
-    assert position.buy_quantity == 0
-    assert position.sell_quantity == 100
-    assert position.avg_bought == 0.0
-    assert position.avg_sold == 162.39
-    assert position.commission == 1.37
-
-    assert position.direction == -1
-    assert position.market_value == -15943.0
-    assert position.avg_price == 162.3763
-    assert position.net_quantity == -100
-    assert position.total_bought == 0.0
-
-    # np.isclose used for floating point precision
-    assert np.isclose(position.total_sold, 16239.0)
-    assert np.isclose(position.net_total, 16239.0)
-    assert np.isclose(position.net_incl_commission, 16237.63)
-    assert np.isclose(position.unrealised_pnl, 294.63)
-    assert np.isclose(position.realised_pnl, 0.0)
-
-
-def test_position_short_twice():
+    if market_update is not None:
+        new_market_price, new_dt = market_update
+        position.update_current_price(new_market_price, new_dt)
+
+        check_position(
+            position, {
+                'current_price': new_market_price,
+                'current_dt': new_dt
+            }
+        )
+
+    check_position(position, expected)
+
+
+def test_transact_for_incorrect_asset():
     """
-    Tests that the properties on the Position
-    are calculated for two consective short trades
-    with differing quantities and market prices.
+    Tests that the 'transact' method, when provided
+    with a Transaction with an Asset that does not
+    match the position's asset, raises an Exception.
     """
-    # Initial short details
-    asset = 'EQ:MSFT'
-    quantity = -100
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 194.55
-    order_id = 123
-    commission = 1.44
-
-    # Create the initial transaction and position
-    first_transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position = Position.open_from_transaction(first_transaction)
-
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
-
-    # Second short
-    second_quantity = -60
-    second_dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    second_price = 194.76
-    second_order_id = 234
-    second_commission = 1.27
-    second_transaction = Transaction(
-        asset,
-        quantity=second_quantity,
-        dt=second_dt,
-        price=second_price,
-        order_id=second_order_id,
-        commission=second_commission
+    position = Position(
+        ASSET_AAPL,
+        current_price=950.0,
+        current_dt=DT_15,
+        buy_quantity=100,
+        sell_quantity=0,
+        avg_bought=950.0,
+        avg_sold=0.0,
+        buy_commission=1.0,
+        sell_commission=0.0
     )
-    position.transact(second_transaction)
-
-    assert position.current_price == second_price
-    assert position.current_dt == second_dt
-
-    assert position.buy_quantity == 0
-    assert position.sell_quantity == 160
-    assert position.avg_bought == 0.0
-    assert position.avg_sold == 194.62875
-    assert position.commission == 2.71
-
-    assert position.direction == -1
-    assert np.isclose(position.market_value, -31161.6)
-    assert np.isclose(position.avg_price, 194.6118125)
-    assert position.net_quantity == -160
-    assert position.total_bought == 0.0
-    assert position.total_sold == 31140.60
-    assert position.net_total == 31140.6
-    assert position.net_incl_commission == 31137.89
-    assert np.isclose(position.unrealised_pnl, -23.71)
-    assert np.isclose(position.realised_pnl, 0.0)
-
-
-def test_position_short_close():
+
+    with pytest.raises(ValueError):
+        do_transact(
+            position,
+            asset=ASSET_AMZN,
+            quantity=50,
+            dt=DT_16,
+            price=960.0,
+            order_id=123,
+            commission=1.0
+        )
+
+
+def test_transact_for_nan_quantity(msft_long):
     """
-    Tests that the properties on the Position
-    are calculated for a short opening trade and
-    subsequent closing trade.
+    Tests that the 'transact' method raises for a
+    Transaction with a NaN quantity.
     """
-    # Initial short details
-    asset = 'EQ:TSLA'
-    quantity = -100
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 982.13
-    order_id = 123
-    commission = 3.18
-
-    # Create the initial transaction and position
-    first_transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position = Position.open_from_transaction(first_transaction)
-
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
-
-    # Closing trade
-    second_quantity = 100
-    second_dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    second_price = 982.13
-    second_order_id = 234
-    second_commission = 1.0
-    second_transaction = Transaction(
-        asset,
-        quantity=second_quantity,
-        dt=second_dt,
-        price=second_price,
-        order_id=second_order_id,
-        commission=second_commission
-    )
-    position.transact(second_transaction)
-
-    assert position.current_price == second_price
-    assert position.current_dt == second_dt
-
-    assert position.buy_quantity == 100
-    assert position.sell_quantity == 100
-    assert position.avg_bought == 982.13
-    assert position.avg_sold == 982.13
-    assert position.commission == 4.18
-
-    assert position.direction == 0
-    assert position.market_value == 0.0
-    assert position.avg_price == 0.0
-    assert position.net_quantity == 0
-    assert position.total_bought == 98213.0
-    assert position.total_sold == 98213.0
-    assert position.net_total == 0.0
-    assert position.net_incl_commission == -4.18
-    assert position.unrealised_pnl == 0.0
-    assert position.realised_pnl == -4.18
-
-
-def test_position_short_and_long():
+    with pytest.raises(ValueError):
+        do_transact(
+            msft_long,
+            asset=msft_long.asset,
+            quantity=float('nan'),
+            dt=DT_16,
+            price=960.0,
+            order_id=123,
+            commission=1.0
+        )
+
+
+def test_cached_values_recalculated_after_update(msft_long):
     """
-    Tests that the properties on the Position
-    are calculated for a short trade followed by
-    a partial closing long trade with differing
-    market prices.
+    Tests that the cached market value and unrealised P&L of
+    a Position are recalculated after a price update.
     """
-    # Initial short details
-    asset = 'EQ:TLT'
-    quantity = -100
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 162.39
-    order_id = 123
-    commission = 1.37
-
-    # Create the initial transaction and position
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
+    market_value = msft_long.market_value
+    msft_long.update_current_price(market_value / msft_long.net_quantity + 1.0)
+    assert msft_long.market_value == pytest.approx(
+        market_value + msft_long.net_quantity
     )
-    position = Position.open_from_transaction(transaction)
-
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
-
-    # Long details and transaction
-    second_quantity = 60
-    second_dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    second_price = 159.99
-    second_order_id = 234
-    second_commission = 1.0
-    second_transaction = Transaction(
-        asset,
-        quantity=second_quantity,
-        dt=second_dt,
-        price=second_price,
-        order_id=second_order_id,
-        commission=second_commission
+    assert msft_long.unrealised_pnl == pytest.approx(
+        (msft_long.current_price - msft_long.avg_price) * msft_long.net_quantity
     )
-    position.transact(second_transaction)
-
-    assert position.current_price == second_price
-    assert position.current_dt == second_dt
-
-    assert position.buy_quantity == 60
-    assert position.sell_quantity == 100
-    assert np.isclose(position.avg_bought, 159.99)
-    assert position.avg_sold == 162.39
-    assert position.commission == 2.37
-
-    assert position.direction == -1
-    assert np.isclose(position.market_value, -6399.6)
-    assert position.avg_price == 162.3763
-    assert position.net_quantity == -40
-    assert np.isclose(position.total_bought, 9599.40)
-    assert np.isclose(position.total_sold, 16239.0)
-    assert np.isclose(position.net_total, 6639.60)
-    assert np.isclose(position.net_incl_commission, 6637.23)
-    assert np.isclose(position.unrealised_pnl, 95.452)
-    assert np.isclose(position.realised_pnl, 142.1779999999)
-
-
-def test_position_short_long_short_long_ending_short():
+
+
+def test_cached_values_recalculated_after_attribute_assignment():
     """
-    Tests that the properties on the Position
-    are calculated for four trades consisting
-    of a short, long, short and long ending net
-    short after all trades with varying quantities
-    and market prices.
+    Tests that assigning to the attributes of a Position
+    invalidates its cached market value and P&L.
     """
-    # First trade (first short)
-    asset = 'EQ:AGG'
-    quantity = -762
-    dt = pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC)
-    price = 117.74
-    order_id = 100
-    commission = 5.35
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position = Position.open_from_transaction(transaction)
-
-    # Second trade (first long)
-    quantity = 477
-    dt = pd.Timestamp('2020-06-16 16:00:00', tz=pytz.UTC)
-    price = 117.875597
-    order_id = 101
-    commission = 2.31
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position.transact(transaction)
-
-    # Third trade (second short)
-    quantity = -595
-    dt = pd.Timestamp('2020-06-16 17:00:00', tz=pytz.UTC)
-    price = 117.74
-    order_id = 102
-    commission = 4.18
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
-    )
-    position.transact(transaction)
-
-    # Fourth trade (second long), now net short
-    quantity = 427
-    dt = pd.Timestamp('2020-06-16 18:00:00', tz=pytz.UTC)
-    price = 117.793115
-    order_id = 103
-    commission = 2.06
-    transaction = Transaction(
-        asset,
-        quantity=quantity,
-        dt=dt,
-        price=price,
-        order_id=order_id,
-        commission=commission
+    position = Position(
+        ASSET_AAPL, 10.0, DT_15, 10, 0, 10.0, 0.0, 0.0, 0.0
     )
-    position.transact(transaction)
-
-    assert position.asset == asset
-    assert position.current_price == price
-    assert position.current_dt == dt
-
-    assert position.buy_quantity == 904
-    assert position.sell_quantity == 1357
-    assert position.avg_bought == 117.83663702876107
-    assert position.avg_sold == 117.74
-    assert np.isclose(position.commission, 13.90)
-
-    assert position.direction == -1
-    assert np.isclose(position.market_value, -53360.281095)
-    assert position.avg_price == 117.73297715549005
-    assert position.net_quantity == -453
-    assert position.total_bought == 106524.31987400001
-    assert np.isclose(position.total_sold, 159773.18)
-    assert np.isclose(position.net_total, 53248.86)
-    assert np.isclose(position.net_incl_commission, 53234.95)
-    assert np.isclose(position.unrealised_pnl, -27.242443563)
-    assert np.isclose(position.realised_pnl, -98.0785254)
+    assert position.market_value == 100.0
 
+    position.current_price = 20.0
+    assert position.market_value == 200.0
+    assert position.unrealised_pnl == 100.0
 
-def test_transact_for_incorrect_asset():
+    position.buy_quantity = 20
+    assert position.market_value == 400.0
+    assert position.avg_price == 10.0
+
+
+def test_position_representation():
     """
-    Tests that the 'transact' method, when provided
-    with a Transaction with an Asset that does not
-    match the position's asset, raises an Exception.
+    Tests that the Position representation
+    correctly recreates the object.
     """
-    asset1 = 'EQ:AAPL'
-    asset2 = 'EQ:AMZN'
-
     position = Position(
-        asset1,
+        ASSET_AAPL,
         current_price=950.0,
-        current_dt=pd.Timestamp('2020-06-16 15:00:00', tz=pytz.UTC),
+        current_dt=DT_15,
         buy_quantity=100,
         sell_quantity=0,
         avg_bought=950.0,
@@ -727,16 +523,10 @@ def test_transact_for_incorrect_asset():
         buy_commission=1.0,
         sell_commission=0.0
     )
-
-    new_dt = pd.Timestamp('2020-06-16 16:00:00')
-    transaction = Transaction(
-        asset2,
-        quantity=50,
-        dt=new_dt,
-        price=960.0,
-        order_id=123,
-        commission=1.0
+    exp_repr = (
+        "Position(asset=EQ:AAPL, current_price=950.0, "
+        "current_dt=%s, buy_quantity=100, sell_quantity=0, "
+        "avg_bought=950.0, avg_sold=0.0, "
+        "buy_commission=1.0, sell_commission=0.0)" % DT_15
     )
-
-    with pytest.raises(Exception):
-        position.update(transaction)
+    assert repr(position) == exp_repr
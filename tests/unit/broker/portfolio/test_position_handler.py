@@ -1,14 +1,12 @@
-from collections import OrderedDict
-
 import numpy as np
 import pandas as pd
-import pytz
+import pytest
 
 from qstrader.broker.portfolio.position_handler import PositionHandler
 from qstrader.broker.transaction.transaction import Transaction
 
 
-def test_transact_position_new_position():
+def test_transact_position_new_position(helpers):
     """
     Tests the 'transact_position' method for a transaction
     with a brand new asset and checks that all objects are
@@ -22,7 +20,7 @@ def test_transact_position_new_position():
     transaction = Transaction(
         asset,
         quantity=100,
-        dt=pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC),
+        dt=helpers.utc_timestamp('2015-05-06 15:00:00'),
         price=960.0,
         order_id=123,
         commission=26.83
@@ -39,7 +37,7 @@ def test_transact_position_new_position():
     assert pos.avg_price == 960.2683000000001
 
 
-def test_transact_position_current_position():
+def test_transact_position_current_position(helpers):
     """
     Tests the 'transact_position' method for a transaction
     with a current asset and checks that all objects are
@@ -49,8 +47,8 @@ def test_transact_position_current_position():
     # carry out a transaction
     ph = PositionHandler()
     asset = 'EQ:AMZN'
-    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
-    new_dt = pd.Timestamp('2015-05-06 16:00:00', tz=pytz.UTC)
+    dt = helpers.utc_timestamp('2015-05-06 15:00:00')
+    new_dt = helpers.utc_timestamp('2015-05-06 16:00:00')
 
     transaction_long = Transaction(
         asset,
@@ -82,7 +80,7 @@ def test_transact_position_current_position():
     assert np.isclose(pos.avg_price, 980.1512)
 
 
-def test_transact_position_quantity_zero():
+def test_transact_position_quantity_zero(helpers):
     """
     Tests the 'transact_position' method for a transaction
     with net zero quantity after the transaction to ensure
@@ -92,8 +90,8 @@ def test_transact_position_quantity_zero():
     # carry out a transaction
     ph = PositionHandler()
     asset = 'EQ:AMZN'
-    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
-    new_dt = pd.Timestamp('2015-05-06 16:00:00', tz=pytz.UTC)
+    dt = helpers.utc_timestamp('2015-05-06 15:00:00')
+    new_dt = helpers.utc_timestamp('2015-05-06 16:00:00')
 
     transaction_long = Transaction(
         asset,
@@ -115,8 +113,8 @@ def test_transact_position_quantity_zero():
     ph.transact_position(transaction_close)
 
     # Go long and then close, then check that the
-    # positions OrderedDict is empty
-    assert ph.positions == OrderedDict()
+    # positions dictionary is empty
+    assert ph.positions == {}
 
 
 def test_total_values_for_no_transactions():
@@ -132,7 +130,7 @@ def test_total_values_for_no_transactions():
     assert ph.total_pnl() == 0.0
 
 
-def test_total_values_for_two_separate_transactions():
+def test_total_values_for_two_separate_transactions(helpers):
     """
     Tests 'total_market_value', 'total_unrealised_pnl',
     'total_realised_pnl' and 'total_pnl' for single
@@ -142,7 +140,7 @@ def test_total_values_for_two_separate_transactions():
 
     # Asset 1
     asset1 = 'EQ:AMZN'
-    dt1 = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+    dt1 = helpers.utc_timestamp('2015-05-06 15:00:00')
     trans_pos_1 = Transaction(
         asset1,
         quantity=75,
@@ -155,7 +153,7 @@ def test_total_values_for_two_separate_transactions():
 
     # Asset 2
     asset2 = 'EQ:MSFT'
-    dt2 = pd.Timestamp('2015-05-07 15:00:00', tz=pytz.UTC)
+    dt2 = helpers.utc_timestamp('2015-05-07 15:00:00')
     trans_pos_2 = Transaction(
         asset2,
         quantity=250,
@@ -171,3 +169,203 @@ def test_total_values_for_two_separate_transactions():
     assert np.isclose(ph.total_unrealised_pnl(), -24.31999999999971)
     assert ph.total_realised_pnl() == 0.0
     assert np.isclose(ph.total_pnl(), -24.31999999999971)
+
+
+# Trades in three assets carried out in batches, including an asset
+# that is closed out and reopened and an asset that is closed out
+# entirely, with each pair of trades made at the same time
+BATCH_DTS = pd.date_range(
+    '2015-05-06 15:00:00', periods=6, freq='h', tz='UTC'
+)
+BATCH_TRADES = [
+    ('EQ:AMZN', 100, 960.0, 26.83),
+    ('EQ:MSFT', -250, 142.58, 8.35),
+    ('EQ:AMZN', -40, 980.0, 11.27),
+    ('EQ:AAPL', 50, 127.62, 3.48),
+    ('EQ:MSFT', 250, 140.13, 8.35),
+    ('EQ:AMZN', 200, 990.0, 18.53),
+    ('EQ:MSFT', 120, 139.54, 4.11),
+    ('EQ:AMZN', 0, 995.0, 0.0),
+    ('EQ:AAPL', -50, 129.11, 3.52),
+    ('EQ:AMZN', -75, 985.0, 9.64),
+]
+
+
+# Further batches of (number of trades carried out in turn beforehand,
+# trades), covering the order in which positions are opened and
+# quantities of less than one unit
+BATCH_CASES = [
+    (0, BATCH_TRADES),
+    # Reopening a position moves it after one opened in between
+    (
+        0,
+        [
+            ('EQ:AMZN', 1, 960.0, 1.0),
+            ('EQ:MSFT', 1, 142.58, 1.0),
+            ('EQ:AMZN', -1, 980.0, 1.0),
+            ('EQ:AMZN', 1, 990.0, 1.0),
+        ]
+    ),
+    # A zero quantity does not open a position
+    (
+        0,
+        [
+            ('EQ:MSFT', 0, 142.58, 0.0),
+            ('EQ:AMZN', 10, 960.0, 1.0),
+            ('EQ:MSFT', 10, 140.13, 1.0),
+        ]
+    ),
+    # A fractional quantity opens a position, but is ignored once open
+    (
+        0,
+        [
+            ('EQ:AMZN', 0.5, 960.0, 1.0),
+            ('EQ:AMZN', 0.3, 980.0, 1.0),
+            ('EQ:AMZN', 2, 990.0, 1.0),
+        ]
+    ),
+    # Existing positions closed out and reopened within the batch
+    (
+        2,
+        [
+            ('EQ:AMZN', 10, 960.0, 1.0),
+            ('EQ:MSFT', 10, 142.58, 1.0),
+            ('EQ:AMZN', -10, 980.0, 1.0),
+            ('EQ:AAPL', 5, 127.62, 1.0),
+            ('EQ:AMZN', 0.5, 990.0, 1.0),
+            ('EQ:AMZN', 0.5, 995.0, 1.0),
+        ]
+    ),
+]
+
+
+def batch_transactions(trades):
+    """
+    Create the Transactions for the batch trades.
+    """
+    return [
+        Transaction(
+            asset, quantity=quantity, dt=BATCH_DTS[i // 2],
+            price=price, order_id=i, commission=commission
+        )
+        for i, (asset, quantity, price, commission) in enumerate(trades)
+    ]
+
+
+def transact_in_turn(transactions):
+    """
+    Create a PositionHandler that has carried out each of
+    the transactions in turn via 'transact_position'.
+    """
+    ph = PositionHandler()
+    for transaction in transactions:
+        ph.transact_position(transaction)
+    return ph
+
+
+def assert_positions_match(ph_batch, ph_seq):
+    """
+    Check that the positions of two PositionHandlers agree.
+    """
+    assert list(ph_batch.positions) == list(ph_seq.positions)
+    for asset, pos_seq in ph_seq.positions.items():
+        pos_batch = ph_batch.positions[asset]
+        assert pos_batch.buy_quantity == pos_seq.buy_quantity
+        assert pos_batch.sell_quantity == pos_seq.sell_quantity
+        assert pos_batch.current_price == pos_seq.current_price
+        assert pos_batch.current_dt == pos_seq.current_dt
+        assert np.isclose(pos_batch.avg_bought, pos_seq.avg_bought)
+        assert np.isclose(pos_batch.avg_sold, pos_seq.avg_sold)
+        assert np.isclose(pos_batch.commission, pos_seq.commission)
+        assert np.isclose(pos_batch.realised_pnl, pos_seq.realised_pnl)
+        assert np.isclose(pos_batch.unrealised_pnl, pos_seq.unrealised_pnl)
+
+
+@pytest.mark.parametrize('prior,trades', BATCH_CASES)
+def test_transact_positions_matches_transact_position(prior, trades):
+    """
+    Tests that the batch 'transact_positions' method produces
+    the same positions as carrying out each transaction in
+    turn via 'transact_position'.
+    """
+    transactions = batch_transactions(trades)
+    ph_batch = transact_in_turn(transactions[:prior])
+    ph_batch.transact_positions(transactions[prior:])
+    assert_positions_match(ph_batch, transact_in_turn(transactions))
+
+
+@pytest.mark.parametrize('prior,trades', BATCH_CASES)
+def test_transact_positions_from_df_matches_transact_position(prior, trades):
+    """
+    Tests that the DataFrame batch 'transact_positions_from_df'
+    method produces the same positions as carrying out each
+    transaction in turn via 'transact_position'.
+    """
+    transactions = batch_transactions(trades)
+    df = pd.DataFrame(
+        trades[prior:], columns=['asset', 'quantity', 'price', 'commission']
+    )
+    df['dt'] = [txn.dt for txn in transactions[prior:]]
+
+    ph_batch = transact_in_turn(transactions[:prior])
+    ph_batch.transact_positions_from_df(df)
+    assert_positions_match(ph_batch, transact_in_turn(transactions))
+
+
+def test_total_values_updated_after_price_update(helpers):
+    """
+    Tests that the cached 'total_market_value' and
+    'total_unrealised_pnl' are recalculated once the
+    current price of a position has been updated.
+    """
+    ph = PositionHandler()
+    asset = 'EQ:AMZN'
+    transaction = Transaction(
+        asset,
+        quantity=100,
+        dt=helpers.utc_timestamp('2015-05-06 15:00:00'),
+        price=960.0,
+        order_id=123,
+        commission=0.0
+    )
+    ph.transact_position(transaction)
+    assert ph.total_market_value() == 96000.0
+    assert ph.total_unrealised_pnl() == 0.0
+
+    ph.update_current_price(
+        asset, 970.0, helpers.utc_timestamp('2015-05-06 16:00:00')
+    )
+    assert ph.total_market_value() == 97000.0
+    assert ph.total_unrealised_pnl() == 1000.0
+
+
+@pytest.mark.parametrize(
+    'quantity,price,hour',
+    [
+        (50, -960.0, 16),  # Negative price
+        (50, 960.0, 14),  # Earlier than the current position time
+        (float('nan'), 960.0, 16),  # NaN quantity
+    ]
+)
+def test_transact_positions_raises(quantity, price, hour, helpers):
+    """
+    Tests that the batch 'transact_positions' method raises
+    for a non-positive price, for a transaction earlier
+    than the current time of the position and for a NaN
+    quantity.
+    """
+    ph = PositionHandler()
+    ph.transact_position(
+        Transaction(
+            'EQ:AMZN', quantity=100,
+            dt=helpers.utc_timestamp('2015-05-06 15:00:00'),
+            price=950.0, order_id=1, commission=0.0
+        )
+    )
+    transaction = Transaction(
+        'EQ:AMZN', quantity=quantity,
+        dt=helpers.utc_timestamp('2015-05-06 %02d:00:00' % hour),
+        price=price, order_id=2, commission=0.0
+    )
+    with pytest.raises(ValueError):
+        ph.transact_positions([transaction])
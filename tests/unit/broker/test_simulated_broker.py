@@ -1,9 +1,9 @@
+from datetime import datetime, timezone
 import queue
 
 import numpy as np
 import pandas as pd
 import pytest
-import pytz
 
 from qstrader.broker.portfolio.portfolio import Portfolio
 from qstrader.broker.simulated_broker import SimulatedBroker
@@ -11,6 +11,20 @@ from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 from qstrader import settings
 
 
+START_DT = pd.Timestamp(datetime(2017, 10, 5, 8, 0, 0, tzinfo=timezone.utc))
+NEW_DT = pd.Timestamp(datetime(2017, 10, 7, 8, 0, 0, tzinfo=timezone.utc))
+
+# Cash balances of a broker without any funds, copied by
+# tests before setting the balance of individual currencies
+ZERO_BALANCES = dict.fromkeys(settings.SUPPORTED['CURRENCIES'], 0.0)
+
+# Total equity of each portfolio and the master
+# account of the 'funded_broker' fixture
+FUNDED_BROKER_EQUITY = {
+    **dict.fromkeys(("1", "2", "3"), 100000.0), "master": 300000.0
+}
+
+
 class ExchangeMock(object):
     def get_latest_asset_bid_ask(self, asset):
         return (np.nan, np.nan)
@@ -62,58 +76,75 @@ class AssetMock(object):
         self.symbol = symbol
 
 
-def test_initial_settings_for_default_simulated_broker():
+# The exchange and data handler mocks are stateless, so
+# a single instance of each is shared across all tests
+EXCHANGE_MOCK = ExchangeMock()
+EXCHANGE_MOCK_EXC = ExchangeMockException()
+EXCHANGE_MOCK_PRICE = ExchangeMockPrice()
+DATA_HANDLER_MOCK = DataHandlerMock()
+DATA_HANDLER_MOCK_PRICE = DataHandlerMockPrice()
+
+
+@pytest.fixture(scope="module")
+def default_broker():
+    """
+    An unfunded SimulatedBroker with the default settings.
+    """
+    return SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
+
+
+@pytest.fixture
+def funded_broker():
+    """
+    A SimulatedBroker with 300,000 USD subscribed to the account
+    and split equally across three portfolios, '1', '2' and '3'.
+    """
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
+    sb.subscribe_funds_to_account(300000.0)
+    for portfolio_id in ("1", "2", "3"):
+        sb.create_portfolio(
+            portfolio_id=portfolio_id, name="My Portfolio #%s" % portfolio_id
+        )
+        sb.subscribe_funds_to_portfolio(portfolio_id, 100000.0)
+    return sb
+
+
+def test_initial_settings_for_default_simulated_broker(default_broker):
     """
     Tests that the SimulatedBroker settings are set
     correctly for default settings.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
     # Test a default SimulatedBroker
-    sb1 = SimulatedBroker(start_dt, exchange, data_handler)
+    sb1 = default_broker
 
-    assert sb1.start_dt == start_dt
-    assert sb1.current_dt == start_dt
-    assert sb1.exchange == exchange
+    assert sb1.start_dt == START_DT
+    assert sb1.current_dt == START_DT
+    assert sb1.exchange == EXCHANGE_MOCK
     assert sb1.account_id is None
     assert sb1.base_currency == "USD"
     assert sb1.initial_funds == 0.0
     assert type(sb1.fee_model) == ZeroFeeModel
 
-    tcb1 = dict(
-        zip(
-            settings.SUPPORTED['CURRENCIES'],
-            [0.0] * len(settings.SUPPORTED['CURRENCIES'])
-        )
-    )
-
-    assert sb1.cash_balances == tcb1
+    assert sb1.cash_balances == ZERO_BALANCES
     assert sb1.portfolios == {}
     assert sb1.open_orders == {}
 
     # Test a SimulatedBroker with some parameters set
     sb2 = SimulatedBroker(
-        start_dt, exchange, data_handler, account_id="ACCT1234",
+        START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, account_id="ACCT1234",
         base_currency="GBP", initial_funds=1e6,
         fee_model=ZeroFeeModel()
     )
 
-    assert sb2.start_dt == start_dt
-    assert sb2.current_dt == start_dt
-    assert sb2.exchange == exchange
+    assert sb2.start_dt == START_DT
+    assert sb2.current_dt == START_DT
+    assert sb2.exchange == EXCHANGE_MOCK
     assert sb2.account_id == "ACCT1234"
     assert sb2.base_currency == "GBP"
     assert sb2.initial_funds == 1e6
     assert type(sb2.fee_model) == ZeroFeeModel
 
-    tcb2 = dict(
-        zip(
-            settings.SUPPORTED['CURRENCIES'],
-            [0.0] * len(settings.SUPPORTED['CURRENCIES'])
-        )
-    )
+    tcb2 = ZERO_BALANCES.copy()
     tcb2["GBP"] = 1e6
 
     assert sb2.cash_balances == tcb2
@@ -121,84 +152,53 @@ def test_initial_settings_for_default_simulated_broker():
     assert sb2.open_orders == {}
 
 
-def test_bad_set_base_currency():
-    """
-    Checks _set_base_currency raises ValueError
-    if a non-supported currency is attempted to be
-    set as the base currency.
-    """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    with pytest.raises(ValueError):
-        SimulatedBroker(
-            start_dt, exchange, data_handler, base_currency="XYZ"
-        )
-
-
-def test_good_set_base_currency():
-    """
-    Checks _set_base_currency sets the currency
-    correctly if it is supported by QSTrader.
-    """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(
-        start_dt, exchange, data_handler, base_currency="EUR"
-    )
-    assert sb.base_currency == "EUR"
-
-
-def test_bad_set_initial_funds():
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'base_currency': "XYZ"},  # Unsupported currency
+        {'initial_funds': -56.34},  # Negative funds
+    ]
+)
+def test_set_base_currency_and_initial_funds_raises(kwargs):
     """
-    Checks _set_initial_funds raises ValueError
-    if initial funds amount is negative.
+    Checks _set_base_currency and _set_initial_funds raise
+    ValueError for a non-supported currency and for a
+    negative initial funds amount respectively.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
     with pytest.raises(ValueError):
-        SimulatedBroker(
-            start_dt, exchange, data_handler, initial_funds=-56.34
-        )
+        SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, **kwargs)
 
 
-def test_good_set_initial_funds():
+@pytest.mark.parametrize(
+    'kwargs,attr,expected',
+    [
+        ({'base_currency': "EUR"}, 'base_currency', "EUR"),
+        ({'initial_funds': 1e4}, 'initial_funds', 1e4),
+    ]
+)
+def test_set_base_currency_and_initial_funds(kwargs, attr, expected):
     """
-    Checks _set_initial_funds sets the initial funds
-    correctly if it is a positive floating point value.
+    Checks _set_base_currency and _set_initial_funds
+    correctly set supported values.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler, initial_funds=1e4)
-    assert sb._set_initial_funds(1e4) == 1e4
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, **kwargs)
+    assert getattr(sb, attr) == expected
 
 
-def test_all_cases_of_set_broker_commission():
+def test_all_cases_of_set_broker_commission(default_broker):
     """
     Tests that _set_broker_commission correctly sets the
     appropriate broker commission model depending upon
     user choice.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
     # Broker commission is None
-    sb1 = SimulatedBroker(start_dt, exchange, data_handler)
-    assert sb1.fee_model.__class__.__name__ == "ZeroFeeModel"
+    assert default_broker.fee_model.__class__.__name__ == "ZeroFeeModel"
 
     # Broker commission is specified as a subclass
     # of FeeModel abstract base class
     bc2 = ZeroFeeModel()
     sb2 = SimulatedBroker(
-        start_dt, exchange, data_handler, fee_model=bc2
+        START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, fee_model=bc2
     )
     assert sb2.fee_model.__class__.__name__ == "ZeroFeeModel"
 
@@ -206,7 +206,7 @@ def test_all_cases_of_set_broker_commission():
     # raises a TypeError
     with pytest.raises(TypeError):
         SimulatedBroker(
-            start_dt, exchange, data_handler, fee_model="bad_fee_model"
+            START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, fee_model="bad_fee_model"
         )
 
 
@@ -215,60 +215,35 @@ def test_set_cash_balances():
     Checks _set_cash_balances for zero and non-zero
     initial_funds.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
     # Zero initial funds
     sb1 = SimulatedBroker(
-        start_dt, exchange, data_handler, initial_funds=0.0
-    )
-    tcb1 = dict(
-        zip(
-            settings.SUPPORTED['CURRENCIES'],
-            [0.0] * len(settings.SUPPORTED['CURRENCIES'])
-        )
+        START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, initial_funds=0.0
     )
-    assert sb1._set_cash_balances() == tcb1
+    assert sb1._set_cash_balances() == ZERO_BALANCES
 
     # Non-zero initial funds
     sb2 = SimulatedBroker(
-        start_dt, exchange, data_handler, initial_funds=12345.0
-    )
-    tcb2 = dict(
-        zip(
-            settings.SUPPORTED['CURRENCIES'],
-            [0.0] * len(settings.SUPPORTED['CURRENCIES'])
-        )
+        START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, initial_funds=12345.0
     )
+    tcb2 = ZERO_BALANCES.copy()
     tcb2["USD"] = 12345.0
     assert sb2._set_cash_balances() == tcb2
 
 
-def test_set_initial_portfolios():
+def test_set_initial_portfolios(default_broker):
     """
     Check _set_initial_portfolios method for return
     of an empty dictionary.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
+    assert default_broker._set_initial_portfolios() == {}
 
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
-    assert sb._set_initial_portfolios() == {}
 
-
-def test_set_initial_open_orders():
+def test_set_initial_open_orders(default_broker):
     """
     Check _set_initial_open_orders method for return
     of an empty dictionary.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
-    assert sb._set_initial_open_orders() == {}
+    assert default_broker._set_initial_open_orders() == {}
 
 
 def test_subscribe_funds_to_account():
@@ -277,11 +252,7 @@ def test_subscribe_funds_to_account():
     * Raising ValueError with negative amount
     * Correctly setting cash_balances for a positive amount
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
 
     # Raising ValueError with negative amount
     with pytest.raises(ValueError):
@@ -299,11 +270,7 @@ def test_withdraw_funds_from_account():
     * Raising ValueError for lack of cash
     * Correctly setting cash_balances for positive amount
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler, initial_funds=1e6)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, initial_funds=1e6)
 
     # Raising ValueError with negative amount
     with pytest.raises(ValueError):
@@ -326,22 +293,13 @@ def test_get_account_cash_balance():
     dictionary, then raise ValueError
     * Otherwise, return the appropriate cash balance
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
     sb = SimulatedBroker(
-        start_dt, exchange, data_handler, initial_funds=1000.0
+        START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK, initial_funds=1000.0
     )
 
     # If currency is None, return the cash balances
     sbcb1 = sb.get_account_cash_balance()
-    tcb1 = dict(
-        zip(
-            settings.SUPPORTED['CURRENCIES'],
-            [0.0] * len(settings.SUPPORTED['CURRENCIES'])
-        )
-    )
+    tcb1 = ZERO_BALANCES.copy()
     tcb1["USD"] = 1000.0
     assert sbcb1 == tcb1
 
@@ -355,35 +313,13 @@ def test_get_account_cash_balance():
     assert sb.get_account_cash_balance(currency="EUR") == 0.0
 
 
-def test_get_account_total_market_value():
+def test_get_account_total_market_value(funded_broker):
     """
     Tests get_account_total_market_value method for:
     * The correct market values after cash is subscribed.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
-
-    # Subscribe all necessary funds and create portfolios
-    sb.subscribe_funds_to_account(300000.0)
-    sb.create_portfolio(portfolio_id="1", name="My Portfolio #1")
-    sb.create_portfolio(portfolio_id="2", name="My Portfolio #1")
-    sb.create_portfolio(portfolio_id="3", name="My Portfolio #1")
-    sb.subscribe_funds_to_portfolio("1", 100000.0)
-    sb.subscribe_funds_to_portfolio("2", 100000.0)
-    sb.subscribe_funds_to_portfolio("3", 100000.0)
-
-    # Check that the market value is correct
-    res_equity = sb.get_account_total_equity()
-    test_equity = {
-        "1": 100000.0,
-        "2": 100000.0,
-        "3": 100000.0,
-        "master": 300000.0
-    }
-    assert res_equity == test_equity
+    res_equity = funded_broker.get_account_total_equity()
+    assert res_equity == FUNDED_BROKER_EQUITY
 
 
 def test_create_portfolio():
@@ -394,11 +330,7 @@ def test_create_portfolio():
     * If it isn't, check that they portfolio and open
     orders dictionary was created correctly.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
 
     # If portfolio_id isn't in the dictionary, then check it
     # was created correctly, along with the orders dictionary
@@ -422,11 +354,7 @@ def test_list_all_portfolio():
     * If empty portfolio dictionary, return empty list
     * If non-empty, return sorted list via the portfolio IDs
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
 
     # If empty portfolio dictionary, return empty list
     assert sb.list_all_portfolios() == []
@@ -436,10 +364,7 @@ def test_list_all_portfolio():
     sb.create_portfolio(portfolio_id="z154", name="My Portfolio #2")
     sb.create_portfolio(portfolio_id="abcd", name="My Portfolio #3")
 
-    res_ports = sorted([
-        p.portfolio_id
-        for p in sb.list_all_portfolios()
-    ])
+    res_ports = sorted(p.portfolio_id for p in sb.list_all_portfolios())
     test_ports = ["1234", "abcd", "z154"]
     assert res_ports == test_ports
 
@@ -451,11 +376,7 @@ def test_subscribe_funds_to_portfolio():
     * Raising ValueError if portfolio does not exist
     * Correctly setting cash_balances for a positive amount
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
 
     # Raising ValueError with negative amount
     with pytest.raises(ValueError):
@@ -487,11 +408,7 @@ def test_withdraw_funds_from_portfolio():
     * Raising ValueError for a lack of cash
     * Correctly setting cash_balances for a positive amount
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
 
     # Raising ValueError with negative amount
     with pytest.raises(ValueError):
@@ -522,11 +439,7 @@ def test_get_portfolio_cash_balance():
     * Raising ValueError if portfolio_id not in keys
     * Correctly obtaining the value after cash transfers
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
 
     # Raising ValueError if portfolio_id not in keys
     with pytest.raises(ValueError):
@@ -547,11 +460,7 @@ def test_get_portfolio_total_market_value():
     * Raising ValueError if portfolio_id not in keys
     * Correctly obtaining the market value after cash transfers
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
 
     # Raising KeyError if portfolio_id not in keys
     with pytest.raises(KeyError):
@@ -566,80 +475,60 @@ def test_get_portfolio_total_market_value():
     assert sb.get_portfolio_total_equity("1234") == 100000.0
 
 
-def test_submit_order():
+def test_submit_order_raises_keyerror_when_no_portfolio():
     """
-    Tests the execute_order method for:
-    * Raises ValueError if no portfolio_id
-    * Raises ValueError if bid/ask is (np.nan, np.nan)
-    * Checks that bid/ask are correctly set dependent
-    upon order direction
-    * Checks that portfolio values are correct after
-    carrying out a transaction
+    Tests the submit_order method raises KeyError
+    if the portfolio_id is not in the keys.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-
-    # Raising KeyError if portfolio_id not in keys
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
-    asset = 'EQ:RDSB'
-    quantity = 100
-    order = OrderMock(asset, quantity)
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
+    order = OrderMock('EQ:RDSB', 100)
     with pytest.raises(KeyError):
         sb.submit_order("1234", order)
 
-    # Raises ValueError if bid/ask is (np.nan, np.nan)
-    exchange_exception = ExchangeMockException()
-    sbnp = SimulatedBroker(start_dt, exchange_exception, data_handler)
+
+def test_execute_order_raises_on_nan_bid_ask():
+    """
+    Tests the _execute_order method raises ValueError
+    if no bid/ask price is available.
+    """
+    sbnp = SimulatedBroker(START_DT, EXCHANGE_MOCK_EXC, DATA_HANDLER_MOCK)
     sbnp.create_portfolio(portfolio_id=1234, name="My Portfolio #1")
-    quantity = 100
-    order = OrderMock(asset, quantity)
+    order = OrderMock('EQ:RDSB', 100)
     with pytest.raises(ValueError):
-        sbnp._execute_order(start_dt, "1234", order)
-
-    # Checks that bid/ask are correctly set dependent on
-    # order direction
-
-    # Positive direction
-    exchange_price = ExchangeMockPrice()
-    data_handler_price = DataHandlerMockPrice()
-
-    sbwp = SimulatedBroker(start_dt, exchange_price, data_handler_price)
-    sbwp.create_portfolio(portfolio_id=1234, name="My Portfolio #1")
-    sbwp.subscribe_funds_to_account(175000.0)
-    sbwp.subscribe_funds_to_portfolio("1234", 100000.00)
-    quantity = 1000
-    order = OrderMock(asset, quantity)
-    sbwp.submit_order("1234", order)
-    sbwp.update(start_dt)
+        sbnp._execute_order(START_DT, "1234", order)
 
-    port = sbwp.portfolios["1234"]
-    assert port.cash == 46530.0
-    assert port.total_market_value == 53470.0
-    assert port.total_equity == 100000.0
-    assert port.pos_handler.positions[asset].unrealised_pnl == 0.0
-    assert port.pos_handler.positions[asset].market_value == 53470.0
-    assert port.pos_handler.positions[asset].net_quantity == 1000
 
-    # Negative direction
-    exchange_price = ExchangeMockPrice()
-    sbwp = SimulatedBroker(start_dt, exchange_price, data_handler_price)
+@pytest.mark.parametrize(
+    'quantity,cash,market_value',
+    [
+        (1000, 46530.0, 53470.0),  # Positive direction
+        (-1000, 153450.0, -53450.0),  # Negative direction
+    ]
+)
+def test_submit_order_positions(quantity, cash, market_value):
+    """
+    Tests the submit_order method for:
+    * Checks that bid/ask are correctly set dependent
+    upon order direction
+    * Checks that portfolio values are correct after
+    carrying out a transaction
+    """
+    asset = 'EQ:RDSB'
+    sbwp = SimulatedBroker(START_DT, EXCHANGE_MOCK_PRICE, DATA_HANDLER_MOCK_PRICE)
     sbwp.create_portfolio(portfolio_id=1234, name="My Portfolio #1")
     sbwp.subscribe_funds_to_account(175000.0)
     sbwp.subscribe_funds_to_portfolio("1234", 100000.00)
-    quantity = -1000
     order = OrderMock(asset, quantity)
     sbwp.submit_order("1234", order)
-    sbwp.update(start_dt)
+    sbwp.update(START_DT)
 
     port = sbwp.portfolios["1234"]
-    assert port.cash == 153450.0
-    assert port.total_market_value == -53450.0
+    assert port.cash == cash
+    assert port.total_market_value == market_value
     assert port.total_equity == 100000.0
     assert port.pos_handler.positions[asset].unrealised_pnl == 0.0
-    assert port.pos_handler.positions[asset].market_value == -53450.0
-    assert port.pos_handler.positions[asset].net_quantity == -1000
+    assert port.pos_handler.positions[asset].market_value == market_value
+    assert port.pos_handler.positions[asset].net_quantity == quantity
 
 
 def test_update_sets_correct_time():
@@ -647,11 +536,6 @@ def test_update_sets_correct_time():
     Tests that the update method sets the current
     time correctly.
     """
-    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
-    new_dt = pd.Timestamp('2017-10-07 08:00:00', tz=pytz.UTC)
-    exchange = ExchangeMock()
-    data_handler = DataHandlerMock()
-
-    sb = SimulatedBroker(start_dt, exchange, data_handler)
-    sb.update(new_dt)
-    assert sb.current_dt == new_dt
+    sb = SimulatedBroker(START_DT, EXCHANGE_MOCK, DATA_HANDLER_MOCK)
+    sb.update(NEW_DT)
+    assert sb.current_dt == NEW_DT
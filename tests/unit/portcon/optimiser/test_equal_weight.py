@@ -1,16 +1,24 @@
+from datetime import datetime, timezone
+
 import pandas as pd
 import pytest
-import pytz
 
 from qstrader.portcon.optimiser.equal_weight import (
     EqualWeightPortfolioOptimiser
 )
 
 
+DT = pd.Timestamp(datetime(2019, 1, 1, 0, 0, 0, tzinfo=timezone.utc))
+
+
 class DataHandlerMock(object):
     pass
 
 
+# Equal weighting never queries its data handler
+DATA_HANDLER = DataHandlerMock()
+
+
 @pytest.mark.parametrize(
     "scale,initial_weights,expected_weights",
     [
@@ -45,7 +53,5 @@ def test_fixed_weight_optimiser(scale, initial_weights, expected_weights):
     Tests initialisation and 'pass through' capability of
     FixedWeightPortfolioOptimiser.
     """
-    dt = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
-    data_handler = DataHandlerMock()
-    fwo = EqualWeightPortfolioOptimiser(scale=scale, data_handler=data_handler)
-    assert fwo(dt, initial_weights) == expected_weights
+    fwo = EqualWeightPortfolioOptimiser(scale=scale, data_handler=DATA_HANDLER)
+    assert fwo(DT, initial_weights) == expected_weights
@@ -1,16 +1,24 @@
+from datetime import datetime, timezone
+
 import pandas as pd
 import pytest
-import pytz
 
 from qstrader.portcon.optimiser.fixed_weight import (
     FixedWeightPortfolioOptimiser
 )
 
 
+DT = pd.Timestamp(datetime(2019, 1, 1, 0, 0, 0, tzinfo=timezone.utc))
+
+
 class DataHandlerMock(object):
     pass
 
 
+# The fixed weights are returned without any market data
+DATA_HANDLER = DataHandlerMock()
+
+
 @pytest.mark.parametrize(
     "initial_weights,expected_weights",
     [
@@ -43,7 +51,5 @@ def test_fixed_weight_optimiser(initial_weights, expected_weights):
     Tests initialisation and 'pass through' capability of
     FixedWeightPortfolioOptimiser.
     """
-    dt = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
-    data_handler = DataHandlerMock()
-    fwo = FixedWeightPortfolioOptimiser(data_handler=data_handler)
-    assert fwo(dt, initial_weights) == expected_weights
+    fwo = FixedWeightPortfolioOptimiser(data_handler=DATA_HANDLER)
+    assert fwo(DT, initial_weights) == expected_weights
@@ -1,8 +1,8 @@
-from unittest.mock import Mock
+from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pandas as pd
 import pytest
-import pytz
 
 
 from qstrader.portcon.order_sizer.dollar_weighted import (
@@ -10,6 +10,27 @@ from qstrader.portcon.order_sizer.dollar_weighted import (
 )
 
 
+DT = pd.Timestamp(datetime(2019, 1, 1, 15, 0, 0, tzinfo=timezone.utc))
+
+# Four unnormalised weights summing to 1.22, along with their
+# expected normalised weights, computed once at import
+FOUR_WEIGHTS = {'EQ:ABC': 0.1, 'EQ:DEF': 0.3, 'EQ:GHI': 0.02, 'EQ:JKL': 0.8}
+FOUR_WEIGHTS_NORMALISED = {
+    asset: weight / 1.22 for asset, weight in FOUR_WEIGHTS.items()
+}
+
+
+@pytest.fixture(scope="module")
+def normalise_sizer():
+    """
+    An order sizer shared across the '_normalise_weights' rows,
+    since normalising the weights does not modify the sizer.
+    """
+    return DollarWeightedCashBufferedOrderSizer(
+        SimpleNamespace(), "1234", SimpleNamespace(), 0.05
+    )
+
+
 @pytest.mark.parametrize(
     "cash_buffer_perc,expected",
     [
@@ -26,9 +47,9 @@ def test_check_set_cash_buffer(cash_buffer_perc, expected):
     Checks that the cash buffer falls into the appropriate
     range and raises otherwise.
     """
-    broker = Mock()
+    broker = SimpleNamespace()
     broker_portfolio_id = "1234"
-    data_handler = Mock()
+    data_handler = SimpleNamespace()
 
     if expected is None:
         with pytest.raises(ValueError):
@@ -47,23 +68,20 @@ def test_check_set_cash_buffer(cash_buffer_perc, expected):
     [
         (
             {'EQ:ABC': 0.2, 'EQ:DEF': 0.6},
-            {'EQ:ABC': 0.25, 'EQ:DEF': 0.75}
+            pytest.approx({'EQ:ABC': 0.25, 'EQ:DEF': 0.75})
         ),
         (
             {'EQ:ABC': 0.5, 'EQ:DEF': 0.5},
-            {'EQ:ABC': 0.5, 'EQ:DEF': 0.5}
+            pytest.approx({'EQ:ABC': 0.5, 'EQ:DEF': 0.5})
         ),
         (
             {'EQ:ABC': 0.01, 'EQ:DEF': 0.01},
-            {'EQ:ABC': 0.5, 'EQ:DEF': 0.5}
-        ),
-        (
-            {'EQ:ABC': 0.1, 'EQ:DEF': 0.3, 'EQ:GHI': 0.02, 'EQ:JKL': 0.8},
-            {'EQ:ABC': 0.1 / 1.22, 'EQ:DEF': 0.3 / 1.22, 'EQ:GHI': 0.02 / 1.22, 'EQ:JKL': 0.8 / 1.22},
+            pytest.approx({'EQ:ABC': 0.5, 'EQ:DEF': 0.5})
         ),
+        (FOUR_WEIGHTS, pytest.approx(FOUR_WEIGHTS_NORMALISED)),
         (
             {'EQ:ABC': 0.0, 'EQ:DEF': 0.0},
-            {'EQ:ABC': 0.0, 'EQ:DEF': 0.0}
+            pytest.approx({'EQ:ABC': 0.0, 'EQ:DEF': 0.0})
         ),
         (
             {'EQ:ABC': -0.2, 'EQ:DEF': 0.6},
@@ -71,25 +89,17 @@ def test_check_set_cash_buffer(cash_buffer_perc, expected):
         ),
     ]
 )
-def test_normalise_weights(weights, expected):
+def test_normalise_weights(normalise_sizer, weights, expected):
     """
     Checks that the _normalise_weights method rescales the weights
     to ensure that they sum to unity.
     """
-    broker = Mock()
-    broker_portfolio_id = "1234"
-    data_handler = Mock()
-    cash_buffer_perc = 0.05
-
-    order_sizer = DollarWeightedCashBufferedOrderSizer(
-        broker, broker_portfolio_id, data_handler, cash_buffer_perc
-    )
     if expected is None:
         with pytest.raises(ValueError):
-            result = order_sizer._normalise_weights(weights)
+            result = normalise_sizer._normalise_weights(weights)
     else:
-        result = order_sizer._normalise_weights(weights)
-        assert result == pytest.approx(expected)
+        result = normalise_sizer._normalise_weights(weights)
+        assert result == expected
 
 
 @pytest.mark.parametrize(
@@ -128,19 +138,19 @@ def test_call(total_equity, cash_buffer_perc, weights, asset_prices, expected):
     Checks that the __call__ method correctly outputs the target
     portfolio from a given set of weights and a timestamp.
     """
-    dt = pd.Timestamp('2019-01-01 15:00:00', tz=pytz.utc)
     broker_portfolio_id = "1234"
 
-    broker = Mock()
-    broker.get_portfolio_total_equity.return_value = total_equity
-    broker.fee_model.calc_total_cost.return_value = 0.0
-
-    data_handler = Mock()
-    data_handler.get_asset_latest_ask_price.side_effect = lambda self, x: asset_prices[x]
+    broker = SimpleNamespace(
+        get_portfolio_total_equity=lambda portfolio_id: total_equity,
+        fee_model=SimpleNamespace(calc_total_cost=lambda *args, **kwargs: 0.0)
+    )
+    data_handler = SimpleNamespace(
+        get_asset_latest_ask_price=lambda dt, asset: asset_prices[asset]
+    )
 
     order_sizer = DollarWeightedCashBufferedOrderSizer(
         broker, broker_portfolio_id, data_handler, cash_buffer_perc
     )
 
-    result = order_sizer(dt, weights)
+    result = order_sizer(DT, weights)
     assert result == expected
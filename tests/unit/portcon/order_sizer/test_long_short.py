@@ -1,8 +1,8 @@
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
-import pytz
 
 
 from qstrader.portcon.order_sizer.long_short import (
@@ -10,6 +10,19 @@ from qstrader.portcon.order_sizer.long_short import (
 )
 
 
+DT = pd.Timestamp('2019-01-01 15:00:00', tz='UTC')
+
+
+@pytest.fixture(scope="module")
+def sizer_deps():
+    """
+    The broker, broker portfolio ID and data handler passed to
+    each order sizer, shared across the tests that never
+    configure the mocks.
+    """
+    return Mock(), "1234", Mock()
+
+
 @pytest.mark.parametrize(
     "gross_leverage,expected",
     [
@@ -22,14 +35,12 @@ from qstrader.portcon.order_sizer.long_short import (
         (5.0, 5.0),
     ]
 )
-def test_check_set_gross_leverage(gross_leverage, expected):
+def test_check_set_gross_leverage(sizer_deps, gross_leverage, expected):
     """
     Checks that the gross leverage falls into the appropriate
     range and raises otherwise.
     """
-    broker = Mock()
-    broker_portfolio_id = "1234"
-    data_handler = Mock()
+    broker, broker_portfolio_id, data_handler = sizer_deps
 
     if expected is None:
         with pytest.raises(ValueError):
@@ -103,14 +114,12 @@ def test_check_set_gross_leverage(gross_leverage, expected):
         )
     ]
 )
-def test_normalise_weights(weights, gross_leverage, expected):
+def test_normalise_weights(sizer_deps, weights, gross_leverage, expected):
     """
     Checks that the _normalise_weights method rescales the weights
     for the correct gross exposure and leverage.
     """
-    broker = Mock()
-    broker_portfolio_id = "1234"
-    data_handler = Mock()
+    broker, broker_portfolio_id, data_handler = sizer_deps
 
     order_sizer = LongShortLeveragedOrderSizer(
         broker, broker_portfolio_id, data_handler, gross_leverage
@@ -120,7 +129,15 @@ def test_normalise_weights(weights, gross_leverage, expected):
             result = order_sizer._normalise_weights(weights)
     else:
         result = order_sizer._normalise_weights(weights)
-        assert result == pytest.approx(expected)
+
+        # Align both weight vectors on the sorted asset symbols
+        assets = sorted(expected)
+        assert sorted(result) == assets
+        assert np.allclose(
+            np.fromiter((result[asset] for asset in assets), dtype=np.float64, count=len(assets)),
+            np.fromiter((expected[asset] for asset in assets), dtype=np.float64, count=len(assets)),
+            rtol=1e-12, atol=1e-12
+        )
 
 
 @pytest.mark.parametrize(
@@ -166,12 +183,13 @@ def test_normalise_weights(weights, gross_leverage, expected):
         )
     ]
 )
-def test_call(total_equity, gross_leverage, weights, asset_prices, expected):
+def test_call(
+    total_equity, gross_leverage, weights, asset_prices, expected
+):
     """
     Checks that the __call__ method correctly outputs the target
     portfolio from a given set of weights and a timestamp.
     """
-    dt = pd.Timestamp('2019-01-01 15:00:00', tz=pytz.utc)
     broker_portfolio_id = "1234"
 
     broker = Mock()
@@ -179,11 +197,13 @@ def test_call(total_equity, gross_leverage, weights, asset_prices, expected):
     broker.fee_model.calc_total_cost.return_value = 0.0
 
     data_handler = Mock()
-    data_handler.get_asset_latest_ask_price.side_effect = lambda self, x: asset_prices[x]
+    data_handler.get_asset_latest_ask_price.side_effect = (
+        lambda dt, asset: asset_prices[asset]
+    )
 
     order_sizer = LongShortLeveragedOrderSizer(
         broker, broker_portfolio_id, data_handler, gross_leverage
     )
 
-    result = order_sizer(dt, weights)
+    result = order_sizer(DT, weights)
     assert result == expected
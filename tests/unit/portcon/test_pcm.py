@@ -2,13 +2,21 @@ from unittest.mock import Mock
 
 import pandas as pd
 import pytest
-import pytz
 
 from qstrader.execution.order import Order
 from qstrader.portcon.pcm import PortfolioConstructionModel
 
 
-SENTINEL_DT = pd.Timestamp('2019-01-01 15:00:00', tz=pytz.utc)
+SENTINEL_DT = pd.Timestamp('2019-01-01 15:00:00', tz='UTC')
+
+
+@pytest.fixture(scope="module")
+def pcm():
+    """
+    A PortfolioConstructionModel with unconfigured mock dependencies,
+    shared across the tests of methods that do not use them.
+    """
+    return PortfolioConstructionModel(Mock(), '1234', Mock(), Mock(), Mock())
 
 
 @pytest.mark.parametrize(
@@ -75,22 +83,11 @@ def test_obtain_full_asset_list(description, port_dict, uni_assets, expected):
         )
     ]
 )
-def test_create_zero_target_weight_vector(description, full_assets, expected):
+def test_create_zero_target_weight_vector(pcm, description, full_assets, expected):
     """
     Tests the _create_zero_target_weight_vector method of the
     PortfolioConstructionModel base class.
     """
-    port_id = '1234'
-
-    broker = Mock()
-    universe = Mock()
-    order_sizer = Mock()
-    optimiser = Mock()
-
-    pcm = PortfolioConstructionModel(
-        broker, port_id, universe, order_sizer, optimiser
-    )
-
     result = pcm._create_zero_target_weight_vector(full_assets)
     assert result == expected
 
@@ -125,23 +122,12 @@ def test_create_zero_target_weight_vector(description, full_assets, expected):
     ]
 )
 def test_create_full_asset_weight_vector(
-    description, zero_weights, optimised_weights, expected
+    pcm, description, zero_weights, optimised_weights, expected
 ):
     """
     Tests the _create_full_asset_weight_vector method of the
     PortfolioConstructionModel base class.
     """
-    port_id = '1234'
-
-    broker = Mock()
-    universe = Mock()
-    order_sizer = Mock()
-    optimiser = Mock()
-
-    pcm = PortfolioConstructionModel(
-        broker, port_id, universe, order_sizer, optimiser
-    )
-
     result = pcm._create_full_asset_weight_vector(zero_weights, optimised_weights)
     assert result == expected
 
@@ -176,7 +162,7 @@ def test_create_full_asset_weight_vector(
             {'EQ:ABC': {'quantity': 345}, 'EQ:DEF': {'quantity': 223}},
             [
                 Order(SENTINEL_DT, 'EQ:ABC', -345),
-                Order(SENTINEL_DT, 'EQ:DEF', -250)
+                Order(SENTINEL_DT, 'EQ:DEF', -223)
             ]
         ),
         (
@@ -212,22 +198,11 @@ def test_create_full_asset_weight_vector(
     ]
 )
 def test_generate_rebalance_orders(
-    helpers, description, target_portfolio, current_portfolio, expected
+    pcm, helpers, description, target_portfolio, current_portfolio, expected
 ):
     """
     Tests the _generate_rebalance_orders method of the
     PortfolioConstructionModel base class.
     """
-    port_id = '1234'
-
-    broker = Mock()
-    universe = Mock()
-    order_sizer = Mock()
-    optimiser = Mock()
-
-    pcm = PortfolioConstructionModel(
-        broker, port_id, universe, order_sizer, optimiser
-    )
-
     result = pcm._generate_rebalance_orders(SENTINEL_DT, target_portfolio, current_portfolio)
     helpers.assert_order_lists_equal(result, expected)
@@ -0,0 +1,55 @@
+import pytest
+
+from qstrader.signals.buffer import AssetPriceBuffers
+
+
+# More prices than the longest lookback, so that the
+# buffers have to discard the earliest of them
+PRICES = [100.0 + 0.5 * i for i in range(15)]
+
+
+@pytest.mark.parametrize(
+    'asset,make_prices',
+    [
+        ('EQ:SPY', list),
+        ('EQ:SPY', iter),
+        ('EQ:AGG', list)
+    ]
+)
+def test_extend_matches_append(asset, make_prices):
+    """
+    Checks that extending the price buffers of an asset,
+    including one not present at creation, is equivalent
+    to appending each price in turn, for both a list and
+    a one-shot iterator of prices.
+    """
+    extended = AssetPriceBuffers(['EQ:SPY'], lookbacks=[6, 12])
+    extended.extend(asset, make_prices(PRICES))
+
+    appended = AssetPriceBuffers(['EQ:SPY'], lookbacks=[6, 12])
+    for price in PRICES:
+        appended.append(asset, price)
+
+    assert extended.prices == appended.prices
+
+
+@pytest.mark.parametrize(
+    'prices',
+    [
+        [99.34, 0.0, 101.87],
+        [-1.0]
+    ]
+)
+def test_extend_raises_for_non_positive_price(prices):
+    """
+    Checks that extending the price buffers with any non-positive
+    price raises and leaves the buffers unchanged.
+    """
+    buffers = AssetPriceBuffers(['EQ:SPY'], lookbacks=[6, 12])
+    buffers.append('EQ:SPY', 98.32)
+
+    with pytest.raises(ValueError):
+        buffers.extend('EQ:SPY', prices)
+    assert [list(buffer) for buffer in buffers.prices.values()] == [
+        [98.32], [98.32]
+    ]
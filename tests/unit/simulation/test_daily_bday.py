@@ -1,6 +1,4 @@
-import pandas as pd
 import pytest
-import pytz
 
 from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
 from qstrader.simulation.event import SimulationEvent
@@ -52,18 +50,19 @@ from qstrader.simulation.event import SimulationEvent
     ]
 )
 def test_daily_rebalance(
-    starting_day, ending_day, pre_market, post_market, expected_events
+    starting_day, ending_day, pre_market, post_market, expected_events,
+    helpers
 ):
     """
     Checks that the daily business day event generation provides
     the correct SimulationEvents for the given parameters.
     """
-    sd = pd.Timestamp(starting_day, tz=pytz.UTC)
-    ed = pd.Timestamp(ending_day, tz=pytz.UTC)
+    sd = helpers.utc_timestamp(starting_day)
+    ed = helpers.utc_timestamp(ending_day)
 
     sim_engine = DailyBusinessDaySimulationEngine(sd, ed, pre_market, post_market)
 
-    for sim_events in zip(sim_engine, expected_events):
-        calculated_event = sim_events[0]
-        expected_event = SimulationEvent(pd.Timestamp(sim_events[1][0], tz=pytz.UTC), sim_events[1][1])
-        assert calculated_event == expected_event
+    assert list(sim_engine) == [
+        SimulationEvent(helpers.utc_timestamp(dt_str), event_type)
+        for dt_str, event_type in expected_events
+    ]
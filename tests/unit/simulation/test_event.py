@@ -1,6 +1,4 @@
-import pandas as pd
 import pytest
-import pytz
 
 from qstrader.simulation.event import SimulationEvent
 
@@ -31,13 +29,13 @@ from qstrader.simulation.event import SimulationEvent
     ]
 )
 def test_sim_event_eq(
-    sim_event_params, compare_event_params, expected_result
+    sim_event_params, compare_event_params, expected_result, helpers
 ):
     """
     Checks that the SimulationEvent __eq__ correctly
     compares SimulationEvent instances.
     """
-    sim_event = SimulationEvent(pd.Timestamp(sim_event_params[0], tz=pytz.UTC), sim_event_params[1])
-    compare_event = SimulationEvent(pd.Timestamp(compare_event_params[0], tz=pytz.UTC), compare_event_params[1])
+    sim_event = SimulationEvent(helpers.utc_timestamp(sim_event_params[0]), sim_event_params[1])
+    compare_event = SimulationEvent(helpers.utc_timestamp(compare_event_params[0]), compare_event_params[1])
 
     assert expected_result == (sim_event == compare_event)